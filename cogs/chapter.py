@@ -1,26 +1,25 @@
 import discord
+import httpx
 import requests
 import re
 import os
 import langcodes
 import zipfile
-import warnings
-import psd_tools
 import shutil
-from PIL import Image
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from discord.ext import commands
 from discord.commands import SlashCommandGroup
 from natsort import natsorted
-from urllib.parse import urlparse
 from utils.embeds import info, error
 from utils.checks import check_authority
-from utils.constants import AuthorityLevel, StaffLevel, JobStatus, JobType
+from utils.constants import AuthorityLevel, StaffLevel, JobStatus, JobType, UploadStatus
 from utils.autocompletes import get_group_list, get_series_list, get_added_jobs, get_chapter_list
 from utils.views import JobboardView
 from utils.titlecase import to_title_case
-
-warnings.filterwarnings("ignore", module="psd_tools")
+from utils.psd import PsdConverter
+from utils.zipstream import stream_extract
+from cogs.jobs import notify_next_stages
+from utils.stages import ChapterStages
 
 def normalize_language(name: str):
     try:
@@ -28,6 +27,50 @@ def normalize_language(name: str):
     except LookupError:
         return None
 
+def parse_chapter_names(value, existing_names = ()):
+    # A name of an existing chapter, or one wrapped in quotes, is kept as is, so "10-11" can stay a single chapter.
+    value = value.strip()
+    if value in existing_names:
+        return [value]
+    if len(value) > 2 and value[0] == value[-1] == '"':
+        return [value[1:-1].strip()]
+
+    # "1, 2, 5-7" becomes ["1", "2", "5", "6", "7"]. Ranges only apply to whole numbers.
+    chapter_names = []
+    for part in value.split(","):
+        part = part.strip()
+        match = re.fullmatch(r'(\d+)\s*-\s*(\d+)', part)
+        if match and int(match[1]) <= int(match[2]):
+            chapter_names.extend(str(number) for number in range(int(match[1]), int(match[2]) + 1))
+        elif part:
+            chapter_names.append(part)
+
+    return list(dict.fromkeys(chapter_names))
+
+def find_drive_link(chapter_name, folders):
+    if not folders:
+        return None
+
+    drive_link = None
+    chapter_name_match = re.search(r'\d+', chapter_name)
+    for item in folders:
+        if item['mimeType'] == "application/vnd.google-apps.folder":
+            # Compare by complete names or by numbers.
+            matches = False
+
+            if chapter_name == item['name']:
+                matches = True
+
+            if not matches and chapter_name_match:
+                item_match = re.search(r'\d+(\.\d+)?', item['name'])
+                if item_match:
+                    matches = float(re.search(r'\d+(\.\d+)?', chapter_name)[0]) == float(item_match[0])
+
+            if matches:
+                drive_link = f"https://drive.google.com/drive/folders/{item['id']}"
+
+    return drive_link
+
 def setup(bot):
     bot.add_cog(Chapter(bot))
 
@@ -41,68 +84,71 @@ class Chapter(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def add(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                    chapter_name: str):
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list),
+                    chapter_name: discord.Option(str, description="Separate chapters with commas or give a range like 1-10. Quote a name to keep it as is.")):
         await ctx.defer()
 
-        chapter_count = ctx.bot.database.series.count_chapters(series_name)
-        if chapter_count and chapter_count >= 25:
+        existing_names = await ctx.bot.database.chapters.get_names(series_name)
+        if existing_names is None:
+            return await ctx.respond(embed=error(f"Failed to get chapters for series `{series_name}`."))
+
+        chapter_names = parse_chapter_names(chapter_name, existing_names)
+        if not chapter_names:
+            return await ctx.respond(embed=error("No chapter names given."))
+
+        # Chapters already in the series are skipped, so only the new ones count towards the limit.
+        new_names = [name for name in chapter_names if name not in existing_names]
+        chapter_count = await ctx.bot.database.series.count_chapters(series_name)
+        if new_names and (chapter_count or 0) + len(new_names) > 25:
             return await ctx.respond(embed=error("Reached the limit of chapters per series. Remove (or archive) some before adding more."))
 
-        chapter_drive_link = None
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
+        if series is None:
+            return await ctx.respond(embed=error(f"Failed to get series `{series_name}` by `{group_name}`."))
+
+        folders = None
         if series.series_drive_link:
-            chapter_name_match = re.search(r'\d+', chapter_name)
             match = re.search(r'/folders/([a-zA-Z0-9_-]+)', series.series_drive_link)
             if match:
-                response = requests.get(f"{os.getenv('KeiretsuUrl')}/api/list?id={match[1]}")
-                if response.status_code == 200:
-                    folders = response.json()
-                    for item in folders.get('files', []):
-                        if item['mimeType'] == "application/vnd.google-apps.folder":
-                            # Compare by complete names or by numbers.
-                            matches = False
-
-                            if chapter_name == item['name']:
-                                matches = True
-
-                            if not matches and chapter_name_match:
-                                item_match = re.search(r'\d+(\.\d+)?', item['name'])
-                                if item_match:
-                                    matches = float(re.search(r'\d+(\.\d+)?', chapter_name)[0]) == float(re.search(r'\d+(\.\d+)?', item['name'])[0])
-
-                            if matches:
-                                chapter_drive_link = f"https://drive.google.com/drive/folders/{item['id']}"
-
-        chapter_id = ctx.bot.database.chapters.new(series_name, chapter_name, chapter_drive_link)
-        if chapter_id is None:
-            return await ctx.respond(embed=error(f"Chapter `{chapter_name}` for series `{series_name}` is already in the database (or errored while adding.)"))
-
-        # Add series-based assignments.
-        series_assignments = ctx.bot.database.series.get_assignments(series.series_id)
-        if series_assignments:
-            for assignment in series_assignments:
-                assignment_id = ctx.bot.database.assignments.new(chapter_id, assignment.series_job_id, assignment.assigned_to)
-                if assignment_id is None:
-                    return await ctx.respond(embed=error("Failed to add series-based assignments for this chapter."))
-
-        warning_message = "\n**Warning:** could not find chapter in Google Drive." if chapter_drive_link is None else ""
-        await ctx.respond(embed=info(f"Chapter `{chapter_name}` for series `{series_name}` has been added." + warning_message))
+                folders = await ctx.bot.keiretsu.list_files(match[1])
+
+        chapters = [(name, find_drive_link(name, folders)) for name in chapter_names]
+        created = await ctx.bot.database.chapters.new_many(series_name, chapters)
+        if not created:
+            if len(chapter_names) == 1:
+                return await ctx.respond(embed=error(f"Chapter `{chapter_name}` for series `{series_name}` is already in the database (or errored while adding.)"))
+            return await ctx.respond(embed=error(f"Chapters for series `{series_name}` are already in the database (or errored while adding.)"))
+
+        created_names = [chapter.chapter_name for chapter in created]
+        skipped = [name for name in chapter_names if name not in created_names]
+        missing_links = [name for name, drive_link in chapters if drive_link is None and name in created_names]
+
+        if len(created_names) == 1:
+            line = f"Chapter `{created_names[0]}` for series `{series_name}` has been added."
+        else:
+            line = f"Chapters {', '.join(f'`{name}`' for name in created_names)} for series `{series_name}` have been added."
+
+        if skipped:
+            line += f"\nAlready in the database: {', '.join(f'`{name}`' for name in skipped)}."
+        if missing_links:
+            line += f"\n**Warning:** could not find {', '.join(f'`{name}`' for name in missing_links)} in Google Drive."
+
+        await ctx.respond(embed=info(line))
 
     @Chapter.command(description="Deletes the chapter from a series.")
     @check_authority(AuthorityLevel.ProjectManager)
     async def delete(self,
                      ctx,
-                     group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                     series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                     chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list))):
+                     group_name: discord.Option(str, autocomplete=get_group_list),
+                     series_name: discord.Option(str, autocomplete=get_series_list),
+                     chapter_name: discord.Option(str, autocomplete=get_chapter_list)):
         await ctx.defer()
 
         if str(ctx.author.id) != os.getenv("DiscordDevId") and str(ctx.author.id) != os.getenv("DiscordOwnerId"):
             return await ctx.respond(embed=error(f"Use the `/chapter archive` command to archive a completed chapter.\nIf you need to delete a chapter, ping <@{os.getenv('DiscordDevId')}>"))
 
-        rows = ctx.bot.database.chapters.delete(series_name, chapter_name)
+        rows = await ctx.bot.database.chapters.delete(series_name, chapter_name)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Chapter `{chapter_name}` for series `{series_name}` has been deleted."))
 
@@ -112,9 +158,9 @@ class Chapter(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def edit(self,
                    ctx,
-                   group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                   series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                   chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
+                   group_name: discord.Option(str, autocomplete=get_group_list),
+                   series_name: discord.Option(str, autocomplete=get_series_list),
+                   chapter_name: discord.Option(str, autocomplete=get_chapter_list),
                    new_name: str = None,
                    new_drive_link: str = None):
         await ctx.defer()
@@ -122,7 +168,7 @@ class Chapter(commands.Cog):
         if not new_name and not new_drive_link:
             return await ctx.respond(embed=error("You must provide at least one of `new_name` or `new_drive_link`."))
 
-        rows = ctx.bot.database.chapters.update(series_name, chapter_name, new_name, new_drive_link)
+        rows = await ctx.bot.database.chapters.update(series_name, chapter_name, new_name, new_drive_link)
 
         if rows and rows > 0:
             updates = []
@@ -143,23 +189,48 @@ class Chapter(commands.Cog):
                               upload_id: discord.Option(int, description="Upload ID.")):
         await ctx.defer()
 
-        scheduled_upload = ctx.bot.database.chapters.get_scheduled_upload(upload_id)
+        scheduled_upload = await ctx.bot.database.chapters.get_scheduled_upload(upload_id)
         if not scheduled_upload:
             return await ctx.respond(embed=error(f"No scheduled upload with ID `{upload_id}` was found."))
         
-        if os.path.exists(scheduled_upload.folder_name):
-            shutil.rmtree(scheduled_upload.folder_name)
-        
-        ctx.bot.database.chapters.delete_upload_schedule(upload_id)
+        canceled = None
+        if scheduled_upload.status != UploadStatus.Running:
+            canceled = await ctx.bot.database.chapters.cancel_upload_schedule(upload_id)
+
+        if canceled is None:
+            return await ctx.respond(embed=error(f"Scheduled upload with ID `{upload_id}` is being uploaded right now and cannot be canceled."))
+
+        if os.path.exists(canceled.folder_name):
+            shutil.rmtree(canceled.folder_name)
+
         await ctx.respond(embed=info(f"Scheduled upload with ID `{upload_id}` has been canceled."))
 
+    @Chapter.command(description="Retries a failed scheduled upload.")
+    @check_authority(AuthorityLevel.Owner)
+    async def schedule_retry(self,
+                             ctx,
+                             upload_id: discord.Option(int, description="Upload ID.")):
+        await ctx.defer()
+
+        scheduled_upload = await ctx.bot.database.chapters.get_scheduled_upload(upload_id)
+        if not scheduled_upload:
+            return await ctx.respond(embed=error(f"No scheduled upload with ID `{upload_id}` was found."))
+
+        if scheduled_upload.status != UploadStatus.Failed:
+            return await ctx.respond(embed=error(f"Scheduled upload with ID `{upload_id}` has not failed. Current status: `{UploadStatus.to_string(scheduled_upload.status)}`."))
+
+        if not await ctx.bot.database.chapters.retry_upload_schedule(upload_id):
+            return await ctx.respond(embed=error(f"Failed to retry scheduled upload with ID `{upload_id}`."))
+
+        await ctx.respond(embed=info(f"Scheduled upload with ID `{upload_id}` will be retried shortly. Websites that were already uploaded are skipped."))
+
     @Chapter.command(description="Schedules a chapter for upload on mangadex.")
     @check_authority(AuthorityLevel.Owner)
     async def schedule(self,
                        ctx,
-                       group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                       series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                       chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
+                       group_name: discord.Option(str, autocomplete=get_group_list),
+                       series_name: discord.Option(str, autocomplete=get_series_list),
+                       chapter_name: discord.Option(str, autocomplete=get_chapter_list),
                        recruitment_page: discord.Option(discord.Attachment, description="Attach recruitment page png.") = None,
                        credit_page: discord.Option(discord.Attachment, description="Attach credit page png.") = None,
                        additional_page1: discord.Option(discord.Attachment, description="Additional page 1") = None,
@@ -171,7 +242,7 @@ class Chapter(commands.Cog):
         if not ctx.guild:
             return await ctx.respond(embed=error("Not allowed in DMs."))
         
-        if not ctx.bot.mangadex.access_token:
+        if not await ctx.bot.mangadex.ensure_login():
             return await ctx.respond(embed=error("MangaDex.API is not initialized. Scheduling is not possible."))
         
         group_names = [group_name]
@@ -179,7 +250,7 @@ class Chapter(commands.Cog):
         # Sanity checks
         groups = []
         for name in group_names:
-            group = ctx.bot.database.groups.get_by_name(name)
+            group = await ctx.bot.database.groups.get_by_name(name)
             if not group:
                 return await ctx.respond(embed=error(f"Failed to get group `{name}`."))
             
@@ -188,20 +259,22 @@ class Chapter(commands.Cog):
 
             groups.append(group)
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` by `{group_name}`."))
         
         if series.blocked_websites and "mangadex" in series.blocked_websites and "cubari" in series.blocked_websites:
             return await ctx.respond(embed=error("All websites are blocked for this series. Cannot upload."))
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if not chapter:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
         
         # Check if chapter is already scheduled for upload.
-        scheduled_upload = ctx.bot.database.chapters.get_scheduled_upload_by_chapter(chapter.chapter_id)
+        scheduled_upload = await ctx.bot.database.chapters.get_scheduled_upload_by_chapter(chapter.chapter_id)
         if scheduled_upload:
+            if scheduled_upload.status == UploadStatus.Failed:
+                return await ctx.respond(embed=error(f"Chapter `{chapter_name}` has a failed scheduled upload with ID `{scheduled_upload.upload_id}`. Retry or cancel it first."))
             return await ctx.respond(embed=error(f"Chapter `{chapter_name}` is already scheduled for upload."))
 
         if chapter.is_archived:
@@ -213,20 +286,19 @@ class Chapter(commands.Cog):
         if not series.mangadex or "mangadex.org/title/" not in series.mangadex:
             return await ctx.respond(embed=error(f"Series `{series_name}` does not have MangaDex link attached or it's incorrect. Cannot upload."))
         
-        response = requests.get(f"{os.getenv('KeiretsuUrl')}/api/list?id={re.search(r'/folders/([a-zA-Z0-9_-]+)', chapter.drive_link)[1]}")
-        if response.status_code != 200:
+        chapter_files = await ctx.bot.keiretsu.list_files(re.search(r'/folders/([a-zA-Z0-9_-]+)', chapter.drive_link)[1])
+        if chapter_files is None:
             return await ctx.respond(embed=error("Failed to list drive files for the chapter or no 'tspr' folder is present."))
         
         typesetting_folder = next(
-            (item for item in response.json().get("files", []) if "tspr" in item["name"]),
+            (item for item in chapter_files if "tspr" in item["name"]),
             None
         )
 
-        response = requests.get(f"{os.getenv('KeiretsuUrl')}/api/list?id={typesetting_folder['id']}")
-        if response.status_code != 200:
+        files = await ctx.bot.keiretsu.list_files(typesetting_folder['id'])
+        if files is None:
             return await ctx.respond(embed=error("Failed to count the amount of pages. Cannot upload."))
         
-        files = response.json().get("files", [])
         filtered_files = [file for file in files if file.get("mimeType") != 'application/vnd.google-apps.folder']
         page_count = len(filtered_files)
 
@@ -408,7 +480,7 @@ class Chapter(commands.Cog):
                 nonlocal ctx
 
                 group_name_str = interaction.data['components'][0]['components'][0]['value']
-                group = ctx.bot.database.groups.get_by_name(group_name_str)
+                group = await ctx.bot.database.groups.get_by_name(group_name_str)
                 if group and "mangadex.org/group/" in group.website:
                     groups.append(group)
 
@@ -432,7 +504,7 @@ class Chapter(commands.Cog):
                 nonlocal ctx
 
                 group_name_str = interaction.data['components'][0]['components'][0]['value']
-                group = ctx.bot.database.groups.get_by_name(group_name_str)
+                group = await ctx.bot.database.groups.get_by_name(group_name_str)
                 if group and group in groups:
                     groups.remove(group)
 
@@ -486,15 +558,10 @@ class Chapter(commands.Cog):
             if not match:
                 return await interaction.message.edit(embed=error("Could not extract ID from the gdrive link."))
             
-            list_url = f"{os.getenv('KeiretsuUrl')}/api/list?id={match[1]}"
-            try:
-                list_response = requests.get(list_url)
-                list_response.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                print(e)
+            files = await ctx.bot.keiretsu.list_files(match[1])
+            if files is None:
                 return await interaction.message.edit(embed=error("An error occurred while fetching the folder list."))
 
-            files = list_response.json()['files']
             tspr_folder_id = None
             for file in files:
                 if 'tspr' in file['name']:
@@ -504,61 +571,54 @@ class Chapter(commands.Cog):
             if not tspr_folder_id:
                 return await interaction.message.edit(embed=error("Could not find the typesetting folder."))
 
-            download_url = f"{os.getenv('KeiretsuUrl')}/api/download_zip?id={tspr_folder_id}"
-
             await interaction.message.edit(embed=info(":hourglass: Downloading PSDs from Google Drive..."))
-            try:
-                response = requests.get(download_url)
-                response.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                print(e)
+            response = await ctx.bot.keiretsu.download_zip(tspr_folder_id)
+            if response is None:
                 return await interaction.message.edit(embed=error("An error occurred while downloading the PSDs. The `tspr` folder might be empty."))
 
             content_disposition = response.headers.get('Content-Disposition', '')
             if 'filename=' in content_disposition:
                 filename = content_disposition.split('filename=')[1].strip('\"')
             else:
-                filename = os.path.basename(urlparse(download_url).path)
+                filename = f"{tspr_folder_id}.zip"
 
             zip_file_path = os.path.join('./data', filename)
             extracted_folder_path = os.path.join('./data', os.path.splitext(filename)[0])
 
-            with open(zip_file_path, 'wb') as f:
-                f.write(response.content)
+            # Pages are converted as soon as they are extracted, while the rest of the archive is still downloading.
+            converter = PsdConverter(ctx.bot.psd_executor, grayscale)
+
+            def on_member(path):
+                if path.lower().endswith('.psd') and os.path.dirname(os.path.normpath(path)) == os.path.normpath(extracted_folder_path):
+                    converter.submit(path)
 
             try:
-                with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                    zip_ref.extractall(extracted_folder_path)
+                await stream_extract(response, zip_file_path, extracted_folder_path, on_member)
             except zipfile.BadZipFile:
+                converter.cancel()
                 return await interaction.message.edit(embed=error("The downloaded file is not a valid zip file."))
-            
+            except httpx.HTTPError as e:
+                converter.cancel()
+                print(f"Error downloading PSDs: {e}")
+                return await interaction.message.edit(embed=error("An error occurred while downloading the PSDs. The `tspr` folder might be empty."))
+
             try:
                 os.remove(zip_file_path)
             except OSError as e:
                 print(f"Error deleting file {zip_file_path}: {e}")
+                converter.cancel()
                 return await interaction.message.edit(embed=error("An error occurred while cleaning up the .zip file."))
 
             await interaction.message.edit(embed=info(":hourglass: Converting .PSDs to .PNGs..."), view=None)
 
             try:
-                psd_files = [f for f in os.listdir(extracted_folder_path) if f.lower().endswith('.psd')]
-                if not psd_files:
+                if not converter.futures:
                      return await interaction.message.edit(embed=error("No PSD files found to convert."))
                 
-                for psd_file in psd_files:
-                    psd_file_path = os.path.join(extracted_folder_path, psd_file)
+                async def report_progress(converted, total):
+                    await interaction.message.edit(embed=info(f":hourglass: Converting .PSDs to .PNGs... (`{converted}/{total}`)"))
 
-                    psd = psd_tools.PSDImage.open(psd_file_path)
-                    image = psd.composite()
-
-                    if grayscale:
-                        image = image.convert('L')
-                        image = image.convert('P', palette=Image.ADAPTIVE, colors=256)
-
-                    png_file_path = os.path.join(extracted_folder_path, os.path.splitext(psd_file)[0] + '.png')
-                    image.save(png_file_path, format='PNG', optimize=True)
-
-                    os.remove(psd_file_path)
+                await converter.wait(report_progress)
 
                 png_files = [f for f in os.listdir(extracted_folder_path) if f.lower().endswith('.png')]
 
@@ -602,7 +662,7 @@ class Chapter(commands.Cog):
                 series_id = re.search(r"mangadex\.org/title/([\w-]+)", series.mangadex)[1]
 
                 websites_to_upload = selected_websites if selected_websites else allowed_websites
-                upload_id = ctx.bot.database.chapters.new_upload_schedule(
+                upload_id = await ctx.bot.database.chapters.new_upload_schedule(
                     volume_number,
                     chapter_number,
                     normalize_language(scan_language),
@@ -701,7 +761,7 @@ class Chapter(commands.Cog):
                         schedule_attempt_issues.append({ "message": "One of the groups' website did not match mangadex group URL regex.", "critical": True })
                         break
 
-                    group_data = ctx.bot.mangadex.group_by_id(match[1])
+                    group_data = await ctx.bot.mangadex.group_by_id(match[1])
                     relationships = group_data["relationships"]
                     if not any(entry["id"] == ctx.bot.mangadex.uploader_uuid for entry in relationships):
                         schedule_attempt_issues.append({ "message": f"`{group.group_name}` does not have `{os.getenv('MangaDexLogin')}` added to its members on mangadex.", "critical": True })
@@ -760,11 +820,11 @@ class Chapter(commands.Cog):
     @Chapter.command(description="Lists all chapters in a series.")
     async def list(self,
                    ctx,
-                   group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                   series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list))):
+                   group_name: discord.Option(str, autocomplete=get_group_list),
+                   series_name: discord.Option(str, autocomplete=get_series_list)):
         await ctx.defer()
 
-        chapters = ctx.bot.database.chapters.get_by_series_name(series_name)
+        chapters = await ctx.bot.database.chapters.get_by_series_name(series_name)
         if not chapters:
             return await ctx.respond(embed=error(f"No chapters found for series `{series_name}`."))
 
@@ -780,10 +840,10 @@ class Chapter(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def jobboard_post(self,
                             ctx,
-                            group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                            series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                            chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                            job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs)),
+                            group_name: discord.Option(str, autocomplete=get_group_list),
+                            series_name: discord.Option(str, autocomplete=get_series_list),
+                            chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                            job_name: discord.Option(str, autocomplete=get_added_jobs),
                             min_level: discord.Option(int, description="Minimum level of staff that is allowed to claim.", choices=StaffLevel.to_choices()),
                             pref_deadline: discord.Option(int, description="Preferred deadline in days (0 for no deadline)."),
                             pages_num: discord.Option(int, description="Number of pages for this chapter.")):
@@ -793,34 +853,34 @@ class Chapter(commands.Cog):
             return await ctx.respond(embed=error("Not allowed in DMs."))
 
         # Sanity checks
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` by `{group_name}`."))
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if not chapter:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
         if chapter.is_archived:
             return await ctx.respond(embed=error(f"Chapter `{chapter_name}` is archived. Cannot post on job board."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if not series_job:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
+        assignment = await ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
         if assignment:
             return await ctx.respond(embed=error(f"Job `{job_name}` for chapter `{chapter_name}` is already claimed. Cannot make a post."))
 
-        job = ctx.bot.database.jobs.get(job_name)
+        job = await ctx.bot.database.jobs.get(job_name)
         if not job or not job.jobboard_channel:
             return await ctx.respond(embed=error(f"Job `{job_name}` does not have a job board channel specified."))
 
         # Check if already posted.
-        if ctx.bot.database.boardposts.get_by_chapter(chapter.chapter_id, series_job.series_job_id):
+        if await ctx.bot.database.boardposts.get_by_chapter(chapter.chapter_id, series_job.series_job_id):
             return await ctx.respond(embed=error(f"There's already a job board post for `{job_name}` for chapter `{chapter_name}`.\nPlease remove if you want to re-post."))
 
-        if ctx.bot.database.boardposts.get_by_series_and_job(series.series_id, series_job.job_id):
+        if await ctx.bot.database.boardposts.get_by_series_and_job(series.series_id, series_job.job_id):
             return await ctx.respond(embed=error("You're allowed to post only 1 chapter per series for a job at a time."))
 
         description = f"Chapter: {chapter_name}"
@@ -843,6 +903,13 @@ class Chapter(commands.Cog):
         embed.add_field(name="⏰ Pref. Deadline", value=deadline, inline=True)
         embed.add_field(name="📄 Num. of Pages", value=f"{pages_num}", inline=True)
 
+        stages = ChapterStages(await ctx.bot.database.assignments.get_stages(chapter.chapter_id))
+        blocking = stages.blocking(series_job.job_type)
+        if blocking:
+            embed.add_field(name="🚦 Status", value="Waiting for " + ", ".join(f"`{JobType.to_string(job_type)}`" for job_type in sorted(blocking)), inline=False)
+        else:
+            embed.add_field(name="🚦 Status", value="Ready to start", inline=False)
+
         if series.thumbnail:
             embed.set_thumbnail(url=series.thumbnail)
 
@@ -853,32 +920,24 @@ class Chapter(commands.Cog):
             int(os.getenv('StaffFullRoleId')): 2
         }
         
-        members_to_check = set()
-        relevant_roles = [ctx.guild.get_role(role_id) for role_id, level in role_to_level.items() if level >= min_level]
-
-        for role in relevant_roles:
-            members_to_check.update(ctx.guild.get_role(role.id).members)
-
-        eligible_members = []
+        # Staff at or above the level who hold the job's role, narrowed down to those who want the ping.
+        staff_ids = set()
+        for role_id, level in role_to_level.items():
+            role = ctx.guild.get_role(role_id)
+            if role and level >= min_level:
+                staff_ids.update(member.id for member in role.members)
 
-        for member in members_to_check:
-            if int(series_job.role_id) in [role.id for role in member.roles]:
-                user_staff_level = -1
-                for role in member.roles:
-                    if role.id in role_to_level:
-                        user_staff_level = max(user_staff_level, role_to_level[role.id])
+        job_role = ctx.guild.get_role(int(series_job.role_id))
+        qualified_ids = staff_ids & { member.id for member in job_role.members } if job_role else set()
 
-                if user_staff_level >= min_level:
-                    mem = ctx.bot.database.members.get(str(member.id))
-                    if mem:
-                        if mem.jobboard_notifications or ctx.bot.database.subscriptions.is_subscribed(mem.member_id, series.series_id):
-                            eligible_members.append(member.mention)
+        recipients = await ctx.bot.database.members.get_jobboard_recipients(series.series_id) or set()
+        eligible_members = [f"<@{member_id}>" for member_id in sorted(qualified_ids) if str(member_id) in recipients]
 
         channel = ctx.bot.get_channel(int(job.jobboard_channel))
         message = await channel.send(content=' '.join(eligible_members), embed=embed, view=JobboardView())
         await message.edit(content=F'`@{StaffLevel.to_string(min_level).lower()}{series_name}{pref_deadline}{pages_num}`')
 
-        boardpost_id = ctx.bot.database.boardposts.new(str(message.id), chapter.chapter_id, series_job.series_job_id, min_level)
+        boardpost_id = await ctx.bot.database.boardposts.new(str(message.id), chapter.chapter_id, series_job.series_job_id, min_level)
         if boardpost_id is None:
             await message.delete()
             return await ctx.respond(embed=error("Failed to create a job board post."))
@@ -889,20 +948,20 @@ class Chapter(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def jobboard_remove(self,
                               ctx,
-                              group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                              series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                              chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                              job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs))):
+                              group_name: discord.Option(str, autocomplete=get_group_list),
+                              series_name: discord.Option(str, autocomplete=get_series_list),
+                              chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                              job_name: discord.Option(str, autocomplete=get_added_jobs)):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if not chapter:
             return await ctx.respond(embed=error(f"Could not find chapter `{chapter_name} in series `{series_name}`"))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
-        job = ctx.bot.database.jobs.get(job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
+        job = await ctx.bot.database.jobs.get(job_name)
 
-        jobboard_post = ctx.bot.database.boardposts.get_by_chapter(chapter.chapter_id, series_job.series_job_id)
+        jobboard_post = await ctx.bot.database.boardposts.get_by_chapter(chapter.chapter_id, series_job.series_job_id)
         if not jobboard_post:
             return await ctx.respond(embed=error(f"Could not find post for `{job_name}` for chapter `{chapter_name}`."))
 
@@ -915,26 +974,26 @@ class Chapter(commands.Cog):
             except (discord.NotFound, discord.Forbidden, discord.HTTPException):
                 pass
 
-        ctx.bot.database.boardposts.delete(jobboard_post.boardpost_id)
+        await ctx.bot.database.boardposts.delete(jobboard_post.boardpost_id)
         await ctx.respond(embed=info(f"The post for `{job_name}` for chapter `{chapter_name}` has been removed."))
 
     @Chapter.command(description="Archives a chapter.")
     @check_authority(AuthorityLevel.ProjectManager)
     async def archive(self,
                       ctx,
-                      group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                      series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                      chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list))):
+                      group_name: discord.Option(str, autocomplete=get_group_list),
+                      series_name: discord.Option(str, autocomplete=get_series_list),
+                      chapter_name: discord.Option(str, autocomplete=get_chapter_list)):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if not chapter:
             return await ctx.respond(embed=error(f"Not found chapter `{chapter_name}` for series `{series_name}`."))
 
         if chapter.is_archived:
             return await ctx.respond(embed=error(f"Chapter `{chapter_name}` for series `{series_name}` is already archived."))
 
-        rows = ctx.bot.database.chapters.archive(chapter.chapter_id)
+        rows = await ctx.bot.database.chapters.archive(chapter.chapter_id)
         if rows is None:
             return await ctx.respond(embed=error(f"Failed to archive chapter `{chapter_name}` for series `{series_name}`"))
 
@@ -943,12 +1002,11 @@ class Chapter(commands.Cog):
         if chapter.drive_link:
             match = re.search(r'/folders/([a-zA-Z0-9_-]+)', chapter.drive_link)
             if match:
-                response = requests.get(f"{os.getenv('KeiretsuUrl')}/api/archive?id={match[1]}")
-                if response.status_code != 200:
+                if not await ctx.bot.keiretsu.archive(match[1]):
                     warning = '\n**Warning:** failed to move to `.archive` folder in Google Drive.'
 
         # Archive assignments associated with the chapter.
-        ctx.bot.database.assignments.delete_for_chapter(chapter.chapter_id) 
+        await ctx.bot.database.assignments.delete_for_chapter(chapter.chapter_id) 
 
         await ctx.respond(embed=info(f"Chapter `{chapter_name}` for series `{series_name}` has been archived." + warning))
 
@@ -956,19 +1014,19 @@ class Chapter(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def unarchive(self,
                         ctx,
-                        group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
+                        group_name: discord.Option(str, autocomplete=get_group_list),
                         series_name: str,
                         chapter_name: str):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if not chapter:
             return await ctx.respond(embed=error(f"Not found chapter `{chapter_name}` for series `{series_name}`."))
 
         if not chapter.is_archived:
             return await ctx.respond(embed=error(f"Chapter `{chapter_name}` for series `{series_name}` is not archived."))
 
-        rows = ctx.bot.database.chapters.unarchive(chapter.chapter_id)
+        rows = await ctx.bot.database.chapters.unarchive(chapter.chapter_id)
         if rows is None:
             return await ctx.respond(embed=error(f"Failed to unarchive chapter `{chapter_name}` for series `{series_name}`."))
 
@@ -976,26 +1034,26 @@ class Chapter(commands.Cog):
         if chapter.drive_link:
             match = re.search(r'/folders/([a-zA-Z0-9_-]+)', chapter.drive_link)
             if match:
-                requests.get(f"{os.getenv('KeiretsuUrl')}/api/unarchive?id={match[1]}")
+                await ctx.bot.keiretsu.unarchive(match[1])
 
         # Restore assignments
-        ctx.bot.database.assignments.restore_for_chapter(chapter.chapter_id)
+        await ctx.bot.database.assignments.restore_for_chapter(chapter.chapter_id)
         await ctx.respond(embed=info(f"Chapter `{chapter_name}` for series `{series_name}` has been unarchived."))
 
     @Chapter.command(description="Shows the progress of a chapter.")
     async def progress(self,
                        ctx,
-                       group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                       series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                       chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list))):
+                       group_name: discord.Option(str, autocomplete=get_group_list),
+                       series_name: discord.Option(str, autocomplete=get_series_list),
+                       chapter_name: discord.Option(str, autocomplete=get_chapter_list)):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if not chapter:
             return await ctx.respond(embed=error(f"Not found chapter `{chapter_name}` for series `{series_name}`."))
 
-        series_jobs = ctx.bot.database.jobs.get_added_all(series_name)
-        if series_jobs is None:
+        rows = await ctx.bot.database.assignments.get_stages(chapter.chapter_id)
+        if rows is None:
             return await ctx.respond(embed=error(f"Failed to get jobs for series `{series_name}`."))
 
         embed = discord.Embed(
@@ -1004,11 +1062,10 @@ class Chapter(commands.Cog):
         )
         embed.set_author(name=f"{series_name} ({group_name})")
 
-        for job in series_jobs:
-            assignment = ctx.bot.database.assignments.get(chapter.chapter_id, job.series_job_id)
-            if not assignment or assignment.status != JobStatus.Completed:
-                embed.description = f"**Chapter {chapter.chapter_name}:** Currently waiting for `{JobType.to_string(job.job_type)}` to be completed.\nWe apologize for any delays {os.getenv('MilizeDownEmoji')}"
-                return await ctx.respond(embed=embed)
+        waiting = ChapterStages(rows).unblocked()
+        if waiting:
+            job_types = ", ".join(f"`{JobType.to_string(job_type)}`" for job_type in waiting)
+            embed.description = f"**Chapter {chapter.chapter_name}:** Currently waiting for {job_types} to be completed.\nWe apologize for any delays {os.getenv('MilizeDownEmoji')}"
 
         await ctx.respond(embed=embed)
 
@@ -1016,25 +1073,35 @@ class Chapter(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def complete(self,
                         ctx,
-                        group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                        series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                        chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list))):
+                        group_name: discord.Option(str, autocomplete=get_group_list),
+                        series_name: discord.Option(str, autocomplete=get_series_list),
+                        chapter_name: discord.Option(str, description="Separate chapters with commas or give a range like 1-10. Quote a name to keep it as is.", autocomplete=get_chapter_list)):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
-        if chapter is None:
-            return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
-
-        assignments = ctx.bot.database.assignments.get_for_chapter(chapter.chapter_id)
-        if not assignments:
-            return await ctx.respond(embed=error(f"No assignments found for chapter `{chapter_name}`."))
-
-        for assignment in assignments:
-            account = True
-            if datetime.now(timezone.utc) - assignment.created_at < timedelta(minutes=5):
-                account = False
-
-            ctx.bot.database.assignments.update_status(chapter.chapter_id, assignment.series_job_id, JobStatus.Completed, account)
-
-        line = f"All assignments in chapter `{chapter_name}` for series `{series_name}` have been marked as `Completed`."
-        await ctx.respond(embed=info(line))
\ No newline at end of file
+        series = await ctx.bot.database.series.get_by_name(series_name)
+        if series is None:
+            return await ctx.respond(embed=error(f"Failed to get series `{series_name}`."))
+
+        # An existing chapter picked from the autocomplete (e.g. "10-11") is completed as is, not split up.
+        existing_names = await ctx.bot.database.chapters.get_names(series_name)
+        if existing_names is None:
+            return await ctx.respond(embed=error(f"Failed to get chapters for series `{series_name}`."))
+
+        chapter_names = parse_chapter_names(chapter_name, existing_names)
+        if not chapter_names:
+            return await ctx.respond(embed=error("No chapter names given."))
+
+        updated = await ctx.bot.database.assignments.bulk_update_status(JobStatus.Completed, series_id=series.series_id, chapter_names=chapter_names)
+        if updated is None:
+            return await ctx.respond(embed=error(f"Failed to complete assignments for series `{series_name}`."))
+        if not updated:
+            return await ctx.respond(embed=error(f"No uncompleted assignments found for chapter `{chapter_name}`."))
+
+        completed = natsorted({ assignment.chapter_name for assignment in updated })
+        if len(completed) == 1:
+            line = f"All assignments in chapter `{completed[0]}` for series `{series_name}` have been marked as `Completed`."
+        else:
+            line = f"All assignments in chapters {', '.join(f'`{name}`' for name in completed)} for series `{series_name}` have been marked as `Completed`."
+        await ctx.respond(embed=info(line))
+
+        await notify_next_stages(ctx, updated)
\ No newline at end of file
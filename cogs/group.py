@@ -20,7 +20,7 @@ class Group(commands.Cog):
     async def add(self, ctx, group_name: str, discord: str = None, website: str = None):
         await ctx.defer()
 
-        group_id = ctx.bot.database.groups.new(group_name, discord, website, ctx.author.id)
+        group_id = await ctx.bot.database.groups.new(group_name, discord, website, ctx.author.id)
         if not group_id:
             await ctx.respond(embed=error(f"Group `{group_name}` is already in the database (or errored while adding).\nPlease use `/group edit` to modify already existing group."))
         else:
@@ -30,12 +30,13 @@ class Group(commands.Cog):
     async def list(self, ctx):
         await ctx.defer()
 
-        groups = ctx.bot.database.groups.get_all()
+        groups = await ctx.bot.database.groups.get_all()
+
+        creators = await ctx.bot.user_resolver.resolve(group.creator_id for group in groups)
 
         output = []
         for i, group in enumerate(groups, start=1):
-            creator = await ctx.bot.get_or_fetch_user(group.creator_id)
-            line = f"**{i}\\. {group.group_name}** by {creator.display_name}"
+            line = f"**{i}\\. {group.group_name}** by {creators[group.creator_id].display_name}"
 
             if group.discord and group.website:
                 line += f"\n[Discord]({group.discord}) • [Website]({group.website})"
@@ -52,7 +53,7 @@ class Group(commands.Cog):
     @check_authority(AuthorityLevel.Owner)
     async def edit(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
+                    group_name: discord.Option(str, autocomplete=get_group_list),
                     new_name: str = None,
                     new_discord: str = None,
                     new_website: str = None):
@@ -61,7 +62,7 @@ class Group(commands.Cog):
         if not new_name and not new_discord and not new_website:
             return await ctx.respond(embed=error("You must provide at least one of `new_name`, `new_discord` or `new_website`."))
 
-        rows = ctx.bot.database.groups.update(group_name, new_name, new_discord, new_website)
+        rows = await ctx.bot.database.groups.update(group_name, new_name, new_discord, new_website)
 
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Group `{group_name}` has been updated."))
@@ -72,10 +73,10 @@ class Group(commands.Cog):
     @check_authority(AuthorityLevel.Owner)
     async def delete(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list))):
+                    group_name: discord.Option(str, autocomplete=get_group_list)):
         await ctx.defer()
 
-        rows = ctx.bot.database.groups.delete(group_name)
+        rows = await ctx.bot.database.groups.delete(group_name)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Group `{group_name}` has been removed from Milize."))
 
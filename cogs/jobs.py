@@ -8,171 +8,61 @@ from utils.embeds import info, error
 from utils.checks import check_authority
 from utils.constants import AuthorityLevel, JobStatus, JobType
 from utils.autocompletes import get_group_list, get_series_list, get_added_jobs, get_job_list, get_chapter_list
-
-async def notify_next_stage(ctx, series_name, chapter, series_job):
-    def other_stages_done(job_type):
-        if job_type == JobType.Translation:
-            # Check if there's no Proofreading, and Cleaning (and/or Redrawing) is completed.
-            pr_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Proofreading)
-            if pr_series_job:
-                return False
-
-            rd_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Redrawing)
-            cl_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Cleaning)
-
-            rd_completed = False
-            cl_completed = False
-
-            if not rd_series_job:
-                rd_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, rd_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    rd_completed = True
-
-            if not cl_series_job:
-                cl_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, cl_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    cl_completed = True
-
-            return rd_completed and cl_completed
-        elif job_type == JobType.Proofreading:
-            # Check if Cleaning (and/or Redrawing) is completed.
-            rd_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Redrawing)
-            cl_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Cleaning)
-
-            rd_completed = False
-            cl_completed = False
-
-            if not rd_series_job:
-                rd_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, rd_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    rd_completed = True
-
-            if not cl_series_job :
-                cl_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, cl_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    cl_completed = True
-
-            return rd_completed and cl_completed
-        elif job_type == JobType.Cleaning:
-            # Check if there's no Redrawing or Proofreading (in that case, check translation) or they're completed.
-            pr_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Proofreading)
-            rd_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Redrawing)
-
-            rd_completed = False
-            pr_completed = False
-
-            if not rd_series_job:
-                rd_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, rd_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    rd_completed = True
-
-            if not pr_series_job:
-                # Check translation.
-                tl_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Translation)
-                if tl_series_job:
-                    assignment = ctx.bot.database.assignments.get(chapter.chapter_id, tl_series_job[0].series_job_id)
-                    if assignment and assignment.status == JobStatus.Completed:
-                        pr_completed = True
-                else:
-                    pr_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, pr_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    pr_completed = True
-
-            return rd_completed and pr_completed
-        elif job_type == JobType.Redrawing:
-            # Check if there's no Cleaning or Proofreading (in that case, check translation) or they're completed.
-            pr_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Proofreading)
-            cl_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Cleaning)
-
-            cl_completed = False
-            pr_completed = False
-
-            if not cl_series_job:
-                cl_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, cl_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    cl_completed = True
-
-            if not pr_series_job:
-                # Check translation.
-                tl_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Translation)
-                if tl_series_job:
-                    assignment = ctx.bot.database.assignments.get(chapter.chapter_id, tl_series_job[0].series_job_id)
-                    if assignment and assignment.status == JobStatus.Completed:
-                        pr_completed = True
-                else:
-                    pr_completed = True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, pr_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    pr_completed = True
-
-            return cl_completed and pr_completed
-        elif job_type == JobType.Typesetting:
-            sfx_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.TypesettingSFX)
-
-            if not sfx_series_job:
-                return True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, sfx_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    return True
-                return False
-        elif job_type == JobType.TypesettingSFX:
-            ts_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, JobType.Typesetting)
-
-            if not ts_series_job:
-                return True
-            else:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, ts_series_job[0].series_job_id)
-                if assignment and assignment.status == JobStatus.Completed:
-                    return True
-                return False
-
-    async def notify_member(job_type, exclude_id = None):
-        notify_series_job = ctx.bot.database.jobs.get_added_by_type(series_name, job_type)
-        if notify_series_job:
-            for job in notify_series_job:
-                assignment = ctx.bot.database.assignments.get(chapter.chapter_id, job.series_job_id)
-                if assignment and assignment.status != JobStatus.Completed and assignment.assigned_to != exclude_id:
-                    member = ctx.bot.database.members.get(assignment.assigned_to)
-                    if member and member.stage_notifications:
-                        await ctx.send(f"<@{assignment.assigned_to}>, chapter `{chapter.chapter_name}` is ready for `{JobType.to_string(job_type)}`.")
-                        ctx.bot.database.assignments.update_available(assignment.assignment_id)
-                        if job_type == JobType.Typesetting:
-                            await notify_member(JobType.TypesettingSFX, assignment.assigned_to)
-
-                        ctx.bot.database.assignments.update_reminder(assignment.assignment_id)
-        else:
-            if job_type == JobType.Typesetting:
-                await notify_member(JobType.TypesettingSFX)
-    
-    if series_job.job_type == JobType.Translation:
-        if other_stages_done(series_job.job_type):
-            await notify_member(JobType.Typesetting)
-        else:
-            await notify_member(JobType.Proofreading)
-    elif series_job.job_type == JobType.Proofreading or series_job.job_type == JobType.Cleaning or series_job.job_type == JobType.Redrawing:
-        if other_stages_done(series_job.job_type):
-            await notify_member(JobType.Typesetting)
-    elif series_job.job_type == JobType.Typesetting or series_job.job_type == JobType.TypesettingSFX:
-        if other_stages_done(series_job.job_type):
-            await notify_member(JobType.Quality)
-    elif series_job.job_type == JobType.Quality:
-        await notify_member(JobType.Managment)
+from utils.stages import ChapterStages
+
+async def notify_next_stage(ctx, chapter, series_job):
+    await notify_unlocked(ctx, { chapter.chapter_id: (chapter.chapter_name, { series_job.job_type }) })
+
+async def notify_next_stages(ctx, updated):
+    # Batch version of notify_next_stage for the rows returned by assignments.bulk_update_status.
+    completed = {}
+    for assignment in updated:
+        completed.setdefault(assignment.chapter_id, (assignment.chapter_name, set()))[1].add(assignment.job_type)
+
+    await notify_unlocked(ctx, completed)
+
+async def notify_unlocked(ctx, completed):
+    # `completed` maps chapter IDs to their name and the job types just completed in them.
+    # Everyone whose job has just been unblocked gets a ping, but only once per chapter.
+    if not completed:
+        return
+
+    rows = await ctx.bot.database.assignments.get_stages_for_chapters(list(completed))
+    if not rows:
+        return
+
+    by_chapter = {}
+    for row in rows:
+        by_chapter.setdefault(row.chapter_id, []).append(row)
+
+    notified = []
+    lines = []
+    for chapter_id, (chapter_name, job_types) in completed.items():
+        stages = ChapterStages(by_chapter.get(chapter_id, []))
+        unlocked = set()
+        for job_type in job_types:
+            unlocked.update(stages.unlocked_by(job_type))
+
+        pinged = set()
+        for job_type in sorted(unlocked):
+            for job in stages.of_type(job_type):
+                if job.assignment_id and job.status != JobStatus.Completed and job.assigned_to not in pinged and job.stage_notifications:
+                    lines.append(f"<@{job.assigned_to}>, chapter `{chapter_name}` is ready for `{JobType.to_string(job_type)}`.")
+                    notified.append(job.assignment_id)
+                    pinged.add(job.assigned_to)
+
+    message = ""
+    for line in lines:
+        if len(message) + len(line) + 1 > 2000:
+            await ctx.send(message)
+            message = ""
+        message += line + "\n"
+
+    if message:
+        await ctx.send(message)
+
+    if notified:
+        await ctx.bot.database.assignments.update_notified(notified)
 
 
 def setup(bot):
@@ -193,7 +83,7 @@ class Jobs(commands.Cog):
                     job_type: discord.Option(int, choices=JobType.to_choices())):
         await ctx.defer()
 
-        job_id = ctx.bot.database.jobs.new(job_name, job_role.id, job_type, ctx.author.id)
+        job_id = await ctx.bot.database.jobs.new(job_name, job_role.id, job_type, ctx.author.id)
         if not job_id:
             await ctx.respond(embed=error(f"Job `{job_name}` is already in the database (or errored while adding).\nPlease use `/job edit` to modify already existing job."))
         else:
@@ -203,13 +93,13 @@ class Jobs(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def edit(self,
                 ctx,
-                job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_job_list)),
+                job_name: discord.Option(str, autocomplete=get_job_list),
                 new_job_name: str = None,
                 new_job_role: discord.Role = None,
                 new_job_type: discord.Option(int, choices=JobType.to_choices()) = None):
         await ctx.defer()
 
-        job = ctx.bot.database.jobs.get(job_name)
+        job = await ctx.bot.database.jobs.get(job_name)
         if job is None:
             return await ctx.respond(embed=error(f"Job `{job_name}` does not exist in the database."))
 
@@ -217,7 +107,7 @@ class Jobs(commands.Cog):
         updated_job_type = new_job_type if new_job_type is not None else job.job_type
         updated_job_name = new_job_name if new_job_name else job.job_name
 
-        rows = ctx.bot.database.jobs.update(job_name, updated_role_id, updated_job_type, updated_job_name)
+        rows = await ctx.bot.database.jobs.update(job_name, updated_role_id, updated_job_type, updated_job_name)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Job `{job_name}` has been successfully updated."))
 
@@ -227,10 +117,10 @@ class Jobs(commands.Cog):
     @check_authority(AuthorityLevel.Owner)
     async def delete(self,
                      ctx,
-                     job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_job_list))):
+                     job_name: discord.Option(str, autocomplete=get_job_list)):
         await ctx.defer()
 
-        rows = ctx.bot.database.jobs.delete(job_name)
+        rows = await ctx.bot.database.jobs.delete(job_name)
 
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Job `{job_name}` has been deleted from Milize."))
@@ -241,47 +131,47 @@ class Jobs(commands.Cog):
     @check_authority(AuthorityLevel.Member)
     async def claim(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                    chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                    job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs))):
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list),
+                    chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                    job_name: discord.Option(str, autocomplete=get_added_jobs)):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if series is None:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` for group `{group_name}`."))
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if chapter is None:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
         if chapter.is_archived:
             return await ctx.respond(embed=error(f"Chapter `{chapter_name}` is archived. Cannot claim."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if series_job is None:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.assignments.get(chapter[0], series_job[0])
+        assignment = await ctx.bot.database.assignments.get(chapter[0], series_job[0])
         if assignment:
             user = await ctx.bot.get_or_fetch_user(int(assignment[3]))
             return await ctx.respond(embed=error(f"Job `{job_name}` for chapter `{chapter_name}` is already claimed by <@{user.id}>"))
 
-        is_first_job = ctx.bot.database.assignments.is_first(str(ctx.author.id))
-        assignment_id = ctx.bot.database.assignments.new(chapter[0], series_job[0], ctx.author.id)
+        is_first_job = await ctx.bot.database.assignments.is_first(str(ctx.author.id))
+        assignment_id = await ctx.bot.database.assignments.new(chapter[0], series_job[0], ctx.author.id)
         if assignment_id is None:
             return await ctx.respond(embed=error("Failed to create an assignment in the database."))
 
         # Remove from job board if there is a post for this job.
-        jobboard_post = ctx.bot.database.boardposts.get_by_chapter(chapter[0], series_job[0])
+        jobboard_post = await ctx.bot.database.boardposts.get_by_chapter(chapter[0], series_job[0])
         if jobboard_post:
-            job = ctx.bot.database.jobs.get(job_name)
+            job = await ctx.bot.database.jobs.get(job_name)
             channel = ctx.bot.get_channel(int(job.jobboard_channel))
             if channel:
                 message = await channel.fetch_message(int(jobboard_post.message_id))
                 if message:
                     await message.delete()
-                    ctx.bot.database.boardposts.delete(jobboard_post.boardpost_id)
+                    await ctx.bot.database.boardposts.delete(jobboard_post.boardpost_id)
 
         additional_info = []
 
@@ -297,121 +187,121 @@ class Jobs(commands.Cog):
         if is_first_job:
             await ctx.send(embed=info("Since this is your first job, please consider checking if there's any important material to read (like a style guide). Usually, it's available in the pinned messages for the channel of the series."))
 
-        ctx.bot.database.members.update_activity(str(ctx.author.id))
+        await ctx.bot.database.members.update_activity(str(ctx.author.id))
 
     @Jobs.command(description="Assigns a job to a member.")
     @check_authority(AuthorityLevel.ProjectManager) 
     async def assign(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                    chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                    job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs)),
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list),
+                    chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                    job_name: discord.Option(str, autocomplete=get_added_jobs),
                     user: discord.User):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if chapter is None:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
         if chapter.is_archived:
             return await ctx.respond(embed=error(f"Chapter `{chapter_name}` is archived. Cannot assign."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if series_job is None:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.assignments.get(chapter[0], series_job[0])
+        assignment = await ctx.bot.database.assignments.get(chapter[0], series_job[0])
         if assignment:
             assigned_user = await ctx.bot.get_or_fetch_user(int(assignment[3]))
             return await ctx.respond(embed=error(f"Job `{job_name}` for chapter `{chapter_name}` is already assigned to <@{assigned_user.id}>.\nUse `/job reassign` to reassign."))
 
         user_id = str(user.id)
-        member = ctx.bot.database.members.get(user_id)
+        member = await ctx.bot.database.members.get(user_id)
         if member is None:
             return await ctx.respond(embed=error(f"<@{user.id}> is not added to members in Milize."))
 
-        assignment_id = ctx.bot.database.assignments.new(chapter[0], series_job[0], user_id)
+        assignment_id = await ctx.bot.database.assignments.new(chapter[0], series_job[0], user_id)
         if assignment_id is None:
             return await ctx.respond(embed=error("Failed to create an assignment in the database."))
 
         # Remove from job board if there is a post for this job.
-        jobboard_post = ctx.bot.database.boardposts.get_by_chapter(chapter[0], series_job[0])
+        jobboard_post = await ctx.bot.database.boardposts.get_by_chapter(chapter[0], series_job[0])
         if jobboard_post:
-            job = ctx.bot.database.jobs.get(job_name)
+            job = await ctx.bot.database.jobs.get(job_name)
             channel = ctx.bot.get_channel(int(job.jobboard_channel))
             if channel:
                 message = await channel.fetch_message(int(jobboard_post.message_id))
                 if message:
                     await message.delete()
-                    ctx.bot.database.boardposts.delete(jobboard_post.boardpost_id)
+                    await ctx.bot.database.boardposts.delete(jobboard_post.boardpost_id)
 
         await ctx.respond(embed=info(f"Job `{job_name}` has been assigned to <@{user.id}> for chapter `{chapter_name}`."))
 
-        ctx.bot.database.members.update_activity((user.id))
+        await ctx.bot.database.members.update_activity((user.id))
 
     @Jobs.command(description="Assigns a job to a member.")
     @check_authority(AuthorityLevel.ProjectManager) 
     async def reassign(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                    chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                    job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs)),
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list),
+                    chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                    job_name: discord.Option(str, autocomplete=get_added_jobs),
                     user: discord.User):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if chapter is None:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
         if chapter.is_archived:
             return await ctx.respond(embed=error(f"Chapter `{chapter_name}` is archived. Cannot assign."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if series_job is None:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.assignments.get(chapter[0], series_job[0])
+        assignment = await ctx.bot.database.assignments.get(chapter[0], series_job[0])
         if assignment is None:
             return await ctx.respond(embed=error(f"Job `{job_name}` for chapter `{chapter_name}` is not claimed by anyone.\nUse `/job assign` to assign."))
 
         user_id = str(user.id)
-        member = ctx.bot.database.members.get(user_id)
+        member = await ctx.bot.database.members.get(user_id)
         if member is None:
             return await ctx.respond(embed=error(f"{user.mention} is not added to members in Milize."))
 
-        rows = ctx.bot.database.assignments.update_user(assignment.assignment_id, user_id)
+        rows = await ctx.bot.database.assignments.update_user(assignment.assignment_id, user_id)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Job `{job_name}` has been reassigned to <@{user.id}> for chapter `{chapter_name}`."))
 
         await ctx.respond(embed=error("No updates were made."))
 
-        ctx.bot.database.members.update_activity(user_id)
+        await ctx.bot.database.members.update_activity(user_id)
 
     @Jobs.command(description="Unassigns the job of a chapter.")
     @check_authority(AuthorityLevel.ProjectManager)
     async def unassign(self,
                       ctx,
-                      group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                      series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                      chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                      job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs))):
+                      group_name: discord.Option(str, autocomplete=get_group_list),
+                      series_name: discord.Option(str, autocomplete=get_series_list),
+                      chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                      job_name: discord.Option(str, autocomplete=get_added_jobs)):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if chapter is None:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if series_job is None:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
+        assignment = await ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
         if assignment is None:
             return await ctx.respond(embed=error(f"Job `{job_name}` is not claimed by anyone."))
 
-        rows = ctx.bot.database.assignments.delete(chapter.chapter_id, series_job.series_job_id)
+        rows = await ctx.bot.database.assignments.delete(chapter.chapter_id, series_job.series_job_id)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Job `{job_name}` for chapter `{chapter_name}` has been unassigned."))
 
@@ -420,21 +310,21 @@ class Jobs(commands.Cog):
     @Jobs.command(description="Unclaims the job of a chapter.")
     async def unclaim(self,
                       ctx,
-                      group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                      series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                      chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                      job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs))):
+                      group_name: discord.Option(str, autocomplete=get_group_list),
+                      series_name: discord.Option(str, autocomplete=get_series_list),
+                      chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                      job_name: discord.Option(str, autocomplete=get_added_jobs)):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if chapter is None:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if series_job is None:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
+        assignment = await ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
         if assignment is None:
             return await ctx.respond(embed=error(f"Job `{job_name}` is not claimed by anyone."))
 
@@ -442,7 +332,7 @@ class Jobs(commands.Cog):
             user = await ctx.bot.get_or_fetch_user(int(assignment.assigned_to))
             return await ctx.respond(embed=error(f"Job `{job_name}` is claimed by <@{user.id}>. Cannot unclaim."))
 
-        rows = ctx.bot.database.assignments.delete(chapter.chapter_id, series_job.series_job_id)
+        rows = await ctx.bot.database.assignments.delete(chapter.chapter_id, series_job.series_job_id)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Job `{job_name}` for chapter `{chapter_name}` has been unclaimed."))
 
@@ -452,50 +342,38 @@ class Jobs(commands.Cog):
     @check_authority(AuthorityLevel.Member)
     async def list(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                    chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list))):
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list),
+                    chapter_name: discord.Option(str, autocomplete=get_chapter_list)):
         await ctx.defer()
 
         if not ctx.guild or ctx.guild.id != int(os.getenv("StaffGuildId")):
             return await ctx.respond(embed=error("This command is now deprecated. Please use `/chapter progress` to check the progress of a chapter."))
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if chapter is None:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
-        series_jobs = ctx.bot.database.jobs.get_added_all(series_name)
+        series_jobs = await ctx.bot.database.jobs.get_added_all(series_name)
         if series_jobs is None:
             return await ctx.respond(embed=error(f"Failed to get jobs for series `{series_name}`."))
 
         embed = discord.Embed(title=f"Chapter {chapter[1]}", url=chapter.drive_link, color=discord.Color.blue())
         embed.set_author(name=f"Jobs for {series_name} ({group_name})")
 
+        chapter_assignments = await ctx.bot.database.assignments.get_for_chapter(chapter.chapter_id) or []
+        users = await ctx.bot.user_resolver.resolve(assignment.assigned_to for assignment in chapter_assignments)
+
         for i, (series_job_id, job_id, job_name, _, _, _) in enumerate(series_jobs, start=1):
-            assignments = ctx.bot.database.assignments.get_all(chapter.chapter_id, series_job_id)
+            assignments = [assignment for assignment in chapter_assignments if assignment.series_job_id == series_job_id]
             field = ''
 
             if assignments:
                 if len(assignments) == 1:
                     assignment = assignments[0]
-                    user = await ctx.bot.get_or_fetch_user(int(assignment.assigned_to))
-                    member = ctx.bot.database.members.get(assignment.assigned_to)
-
-                    display_name = "<unknown>" if not user else user.display_name
-                    credit_name = member.credit_name if member and member.credit_name else display_name
-
-                    field = f"Assigned to: {credit_name}\nStatus: {JobStatus.to_string(assignment.status)}"
+                    field = f"Assigned to: {users[assignment.assigned_to].name}\nStatus: {JobStatus.to_string(assignment.status)}"
                 else:
-                    user_strings = []
-                    for assignment in assignments:
-                        user = await ctx.bot.get_or_fetch_user(int(assignment.assigned_to))
-                        member = ctx.bot.database.members.get(assignment.assigned_to)
-
-                        display_name = "<unknown>" if not user else user.display_name
-                        credit_name = member.credit_name if member and member.credit_name else display_name
-
-                        user_strings.append(f"{credit_name} ({JobStatus.to_string(assignment.status)})")
-
+                    user_strings = [f"{users[assignment.assigned_to].name} ({JobStatus.to_string(assignment.status)})" for assignment in assignments]
                     field = f"Assigned to:\n{', '.join(user_strings)}"
             else:
                 field = "Assigned to: None\nStatus: Backlog"
@@ -508,7 +386,7 @@ class Jobs(commands.Cog):
     async def list_all(self, ctx):
         await ctx.defer()
         
-        jobs = ctx.bot.database.jobs.get_all()
+        jobs = await ctx.bot.database.jobs.get_all()
 
         output = []
         for i, (_, job_name, role_id, _, _) in enumerate(jobs, start=1):
@@ -524,7 +402,7 @@ class Jobs(commands.Cog):
 
         _user = ctx.author if user is None else user
         user_id = str(ctx.author.id) if user is None else str(user.id)
-        assignments = ctx.bot.database.assignments.get_todo(user_id)
+        assignments = await ctx.bot.database.assignments.get_todo(user_id)
 
         if not assignments:
             return await ctx.respond(embed=error(f"{_user.mention} does not have any assignments to do."))
@@ -562,27 +440,27 @@ class Jobs(commands.Cog):
     @check_authority(AuthorityLevel.Member)
     async def update(self,
                      ctx,
-                     group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                     series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                     chapter_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_chapter_list)),
-                     job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs)),
+                     group_name: discord.Option(str, autocomplete=get_group_list),
+                     series_name: discord.Option(str, autocomplete=get_series_list),
+                     chapter_name: discord.Option(str, autocomplete=get_chapter_list),
+                     job_name: discord.Option(str, autocomplete=get_added_jobs),
                      status: discord.Option(int, choices=JobStatus.to_choices()),
                      silent: discord.Option(bool) = False):
         await ctx.defer()
 
-        chapter = ctx.bot.database.chapters.get(series_name, chapter_name)
+        chapter = await ctx.bot.database.chapters.get(series_name, chapter_name)
         if chapter is None:
             return await ctx.respond(embed=error(f"Failed to get chapter `{chapter_name}` for series `{series_name}`."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if series_job is None:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
+        assignment = await ctx.bot.database.assignments.get(chapter.chapter_id, series_job.series_job_id)
         if assignment is None:
             return await ctx.respond(embed=error(f"Job `{job_name}` is not claimed by anyone."))
 
-        member = ctx.bot.database.members.get(str(ctx.author.id))
+        member = await ctx.bot.database.members.get(str(ctx.author.id))
         if assignment.assigned_to != str(ctx.author.id) and member.authority_level < AuthorityLevel.ProjectManager:
             user = await ctx.bot.get_or_fetch_user(int(assignment.assigned_to))
             return await ctx.respond(embed=error(f"Job `{job_name}` is claimed by <@{user.id}>. Not allowed to update the status."))
@@ -591,7 +469,7 @@ class Jobs(commands.Cog):
         if status == JobStatus.Completed and datetime.now(timezone.utc) - assignment.created_at < timedelta(minutes=5):
             account = False
 
-        rows = ctx.bot.database.assignments.update_status(chapter.chapter_id, series_job.series_job_id, status, account)
+        rows = await ctx.bot.database.assignments.update_status(chapter.chapter_id, series_job.series_job_id, status, account)
         if rows is not None:
             line = f"Updated job `{job_name}` for chapter `{chapter_name}` to `{JobStatus.to_string(status)}`."
             if status == JobStatus.Completed and assignment.assigned_to == str(ctx.author.id):
@@ -625,7 +503,7 @@ class Jobs(commands.Cog):
                             await lead_notification_channel.send(embed=embed)
 
                 # Next stage notification
-                await notify_next_stage(ctx, series_name, chapter, series_job)
+                await notify_next_stage(ctx, chapter, series_job)
 
                 # if not account:
                     # await ctx.send(embed=warning("The time between claiming and completing is too short. This job won't be counted towards your statistics."))
@@ -637,11 +515,11 @@ class Jobs(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def jobboard_set(self,
                            ctx,
-                           job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_job_list)), 
+                           job_name: discord.Option(str, autocomplete=get_job_list), 
                            channel: discord.TextChannel):
         await ctx.defer()
 
-        rows = ctx.bot.database.jobs.set_jobboard(job_name, channel.id)
+        rows = await ctx.bot.database.jobs.set_jobboard(job_name, channel.id)
         if rows is None:
             return await ctx.respond(embed=error("Failed to set the job board channel."))
 
@@ -651,10 +529,10 @@ class Jobs(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def jobboard_remove(self,
                               ctx,
-                              job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_job_list))):
+                              job_name: discord.Option(str, autocomplete=get_job_list)):
         await ctx.defer()
 
-        rows  = ctx.bot.database.jobs.set_jobboard(job_name, None)
+        rows  = await ctx.bot.database.jobs.set_jobboard(job_name, None)
         if rows is None:
             return await ctx.respond(embed=error("Failed to remove the job board channel."))
 
@@ -46,10 +46,10 @@ class Member(commands.Cog):
                   authority: discord.Option(int, choices=AuthorityLevel.to_choices())):
         await ctx.defer()
 
-        if ctx.bot.database.members.get_retired(str(user.id)):
+        if await ctx.bot.database.members.get_retired(str(user.id)):
             return await ctx.respond(embed=error(f"{user.mention} is currently in inactive category. Cannot add them again."))
 
-        member_id = ctx.bot.database.members.add(str(user.id), authority)
+        member_id = await ctx.bot.database.members.add(str(user.id), authority)
         if member_id:
             return await ctx.respond(embed=info(f"<@{user.id}> has been added to members with authority level `{AuthorityLevel.to_string(authority)}`."))
 
@@ -62,11 +62,11 @@ class Member(commands.Cog):
                      user: discord.User):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get(str(user.id))
+        member = await ctx.bot.database.members.get(str(user.id))
         if not member:
             return await ctx.respond(embed=error(f"{user.mention} is not added to Milize."))
 
-        rows = ctx.bot.database.members.delete(str(user.id))
+        rows = await ctx.bot.database.members.delete(str(user.id))
         if rows is None:
             return await ctx.respond(embed=error(f"Failed to remove {user.mention} from the database."))
 
@@ -85,15 +85,12 @@ class Member(commands.Cog):
         _user = ctx.author if user is None else user
         member_id = str(_user.id)
 
-        member = ctx.bot.database.members.get(member_id)
+        member = await ctx.bot.database.members.get(member_id)
         if member is None:
             return await ctx.respond(embed=error(f"<@{_user.id}> is not added to members in Milize."))
 
-        assignments = ctx.bot.database.assignments.get_completed_by_user(member_id) or []
-        archived_assignments = ctx.bot.database.assignments.get_completed_by_user_archive(member_id) or []
-
-        all_assignments = assignments + archived_assignments
-        total_completed = len(all_assignments)
+        activity = await ctx.bot.database.members.get_activity(member_id)
+        total_completed = activity.total_completed if activity else 0
 
         def convert_to_utc(dt):
             if dt.tzinfo is None:
@@ -101,12 +98,11 @@ class Member(commands.Cog):
             return dt.astimezone(timezone.utc)
 
 
-        qualified_jobs = ctx.bot.database.jobs.get_by_roles([str(role.id) for role in _user.roles])
+        qualified_jobs = await ctx.bot.database.jobs.get_by_roles([str(role.id) for role in _user.roles])
         qualified_jobs_list = ", ".join(f"`{job}`" for job in qualified_jobs) if qualified_jobs else "None"
 
         now = datetime.now(timezone.utc)
-        completed_at_dates = [convert_to_utc(a.completed_at) for a in all_assignments if a.completed_at]
-        last_job = max(completed_at_dates, default=None)
+        last_job = convert_to_utc(activity.last_completed_at) if activity and activity.last_completed_at else None
         last_job_diff = (now - last_job).days if last_job else "N/A"
         
            
@@ -136,11 +132,11 @@ class Member(commands.Cog):
 
         user_id = str(ctx.author.id)
         if reminder is not None or jobboard is not None or stage is not None:
-            rows = self.bot.database.members.update_notifications(user_id, reminder, jobboard, stage)
+            rows = await self.bot.database.members.update_notifications(user_id, reminder, jobboard, stage)
             if rows is None:
                 return await ctx.respond(embed=error("Failed to update your notification preferences."))
         
-        member = self.bot.database.members.get(user_id)
+        member = await self.bot.database.members.get(user_id)
         embed = discord.Embed(
             title="Notification Preferences",
             color=discord.Color.blue()
@@ -156,25 +152,25 @@ class Member(commands.Cog):
     @check_authority(AuthorityLevel.Member)
     async def series_subscribe(self,
                                ctx,
-                               group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                               series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list))):
+                               group_name: discord.Option(str, autocomplete=get_group_list),
+                               series_name: discord.Option(str, autocomplete=get_series_list)):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get(str(ctx.author.id))
+        member = await ctx.bot.database.members.get(str(ctx.author.id))
         if not member:
             return await ctx.respond(embed=error("You're not added to members in Milize."))
 
         if member.jobboard_notifications:
             return await ctx.respond(embed=error("Please disable `jobboard_notifications` in `/member notifications` before subscribing to specific series."))
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` from `{group_name}`."))
 
-        if ctx.bot.database.subscriptions.is_subscribed(member.member_id, series.series_id):
+        if await ctx.bot.database.subscriptions.is_subscribed(member.member_id, series.series_id):
             return await ctx.respond(embed=error(f"You're already subscribed to the series `{series_name}` from `{group_name}`."))
 
-        subscription_id = ctx.bot.database.subscriptions.new(member.member_id, series.series_id)
+        subscription_id = await ctx.bot.database.subscriptions.new(member.member_id, series.series_id)
         if subscription_id is None:
             return await ctx.respond(embed=error(f"Failed to subscribe to series `{series_name}` from `{group_name}`"))
 
@@ -184,22 +180,22 @@ class Member(commands.Cog):
     @check_authority(AuthorityLevel.Member)
     async def series_unsubscribe(self,
                                 ctx,
-                                group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                                series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list))):
+                                group_name: discord.Option(str, autocomplete=get_group_list),
+                                series_name: discord.Option(str, autocomplete=get_series_list)):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get(str(ctx.author.id))
+        member = await ctx.bot.database.members.get(str(ctx.author.id))
         if not member:
             return await ctx.respond(embed=error("You're not added to members in Milize."))
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Series `{series_name}` from `{group_name}` not found."))
 
-        if not ctx.bot.database.subscriptions.is_subscribed(member.member_id, series.series_id):
+        if not await ctx.bot.database.subscriptions.is_subscribed(member.member_id, series.series_id):
             return await ctx.respond(embed=error(f"You're not subscribed to the series `{series_name}` from `{group_name}`."))
 
-        rows = ctx.bot.database.subscriptions.delete(member.member_id, series.series_id)
+        rows = await ctx.bot.database.subscriptions.delete(member.member_id, series.series_id)
         if rows is None:
             return await ctx.respond(embed=error(f"Failed to unsubscribe from series `{series_name}` from `{group_name}`."))
 
@@ -210,11 +206,11 @@ class Member(commands.Cog):
     async def remove_subscriptions(self, ctx):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get(str(ctx.author.id))
+        member = await ctx.bot.database.members.get(str(ctx.author.id))
         if not member:
             return await ctx.respond(embed=error("You're not added to members in Milize."))
 
-        rows = ctx.bot.database.subscriptions.delete_all(member.member_id)
+        rows = await ctx.bot.database.subscriptions.delete_all(member.member_id)
         if rows is None:
             return await ctx.respond(embed=error("Failed to remove your subscriptions."))
 
@@ -225,11 +221,11 @@ class Member(commands.Cog):
     async def subscriptions(self, ctx):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get(str(ctx.author.id))
+        member = await ctx.bot.database.members.get(str(ctx.author.id))
         if not member:
             return await ctx.respond(embed=error("You're not added to members in Milize."))
 
-        subscriptions = ctx.bot.database.subscriptions.get_all(member.member_id)
+        subscriptions = await ctx.bot.database.subscriptions.get_all(member.member_id)
 
         if not subscriptions:
             return await ctx.respond(embed=error("You're not subscribed to any series."))
@@ -258,7 +254,7 @@ class Member(commands.Cog):
         if credit_name.lower() == 'none':
             credit_name = None
         
-        rows = ctx.bot.database.members.set_credit_name(str(ctx.author.id), credit_name)
+        rows = await ctx.bot.database.members.set_credit_name(str(ctx.author.id), credit_name)
         if rows is None:
             return await ctx.respond(embed=error("Failed to set the credit name."))
 
@@ -275,11 +271,11 @@ class Member(commands.Cog):
                             authority: discord.Option(int, choices=AuthorityLevel.to_choices())):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get(str(user.id))
+        member = await ctx.bot.database.members.get(str(user.id))
         if member is None:
             return await ctx.respond(embed=error(f"<@{user.id}> is not added to members in Milize."))
 
-        rows = ctx.bot.database.members.set_authority(str(user.id), authority)
+        rows = await ctx.bot.database.members.set_authority(str(user.id), authority)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Authority level has been updated for <@{user.id}> to `{AuthorityLevel.to_string(authority)}`"))
 
@@ -289,7 +285,7 @@ class Member(commands.Cog):
     async def restore(self, ctx):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get_retired(str(ctx.author.id))
+        member = await ctx.bot.database.members.get_retired(str(ctx.author.id))
         if not member:
             return await ctx.respond(embed=error(f"Could not find {ctx.author.mention} in retired staff. Cannot restore."))
 
@@ -304,7 +300,7 @@ class Member(commands.Cog):
                     if role:
                         await user.add_roles(role, reason="Member restore. Moving to active staff.")
 
-                ctx.bot.database.members.restore_from_retired(member.member_id)
+                await ctx.bot.database.members.restore_from_retired(member.member_id)
                 inactivity_channel = ctx.bot.get_channel(int(os.getenv("InactivityChannelId")))
                 if inactivity_channel:
                     role_mappings = {
@@ -337,7 +333,7 @@ class Member(commands.Cog):
             return await ctx.respond(embed=error("`days` argument must be between 1 and 90."))
 
         user_id = str(restore_user.id)
-        member = ctx.bot.database.members.get_retired(user_id)
+        member = await ctx.bot.database.members.get_retired(user_id)
         if not member:
             return await ctx.respond(embed=error(f"Could not find {restore_user.mention} in retired staff. Cannot restore."))
 
@@ -352,7 +348,7 @@ class Member(commands.Cog):
                     if role:
                         await user.add_roles(role, reason="Member restore. Moving to active staff.")
 
-                ctx.bot.database.members.restore_from_retired(member.member_id, days)
+                await ctx.bot.database.members.restore_from_retired(member.member_id, days)
                 inactivity_channel = ctx.bot.get_channel(int(os.getenv("InactivityChannelId")))
                 if inactivity_channel:
                     role_mappings = {
@@ -381,7 +377,7 @@ class Member(commands.Cog):
     async def admit(self, ctx, user: discord.User):
         await ctx.defer()
 
-        member = ctx.bot.database.members.get(str(user.id))
+        member = await ctx.bot.database.members.get(str(user.id))
         if member:
             return await ctx.respond(embed=error(f"{user.mention} is already added to members in Milize. Cannot admit."))
 
@@ -395,7 +391,7 @@ class Member(commands.Cog):
             os.getenv("StaffFullRoleId"): "Full"
         }
 
-        jobs = ctx.bot.database.jobs.get_all() 
+        jobs = await ctx.bot.database.jobs.get_all() 
 
         embed = discord.Embed(
             title=f"Admit {user.display_name} to Staff",
@@ -505,7 +501,7 @@ class Member(commands.Cog):
             try:
                 await user.add_roles(*roles_to_add)
                 await interaction.message.edit(embed=info(f"Admitted {user.mention} to `{roles_mapping.get(selected_role)} Staff` with specified qualifications."), view=None)
-                ctx.bot.database.members.add(str(user.id), AuthorityLevel.Member)
+                await ctx.bot.database.members.add(str(user.id), AuthorityLevel.Member)
 
                 channel = ctx.bot.get_channel(int(os.getenv("StaffChannelId")))
                 if channel:
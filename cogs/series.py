@@ -15,7 +15,7 @@ def normalize_series_name(name: str) -> str:
     return re.sub(r"[^\w\-]", "_", name.strip().lower())
 
 async def get_series_list_by_source(ctx: discord.AutocompleteContext):
-    series_list = ctx.bot.database.series.get_by_group_name(ctx.options['source_group_name'])
+    series_list = await ctx.bot.database.series.get_by_group_name(ctx.options['source_group_name'])
 
     if series_list:
         return [series.series_name for series in series_list]
@@ -23,7 +23,7 @@ async def get_series_list_by_source(ctx: discord.AutocompleteContext):
     return []
 
 async def get_series_list_by_target(ctx: discord.AutocompleteContext):
-    series_list = ctx.bot.database.series.get_by_group_name(ctx.options['target_group_name'])
+    series_list = await ctx.bot.database.series.get_by_group_name(ctx.options['target_group_name'])
 
     if series_list:
         return [series.series_name for series in series_list]
@@ -43,7 +43,7 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def add(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
+                    group_name: discord.Option(str, autocomplete=get_group_list),
                     series_name: str,
                     drive_link: str,
                     style_guide: str = None,
@@ -52,7 +52,7 @@ class Series(commands.Cog):
                     thumbnail: str = None):
         await ctx.defer()
 
-        group = ctx.bot.database.groups.get_by_name(group_name)
+        group = await ctx.bot.database.groups.get_by_name(group_name)
         if group is None:
             return await ctx.respond(embed=error(f"Group `{group_name}` does not exist or failed to fetch it."))
 
@@ -60,7 +60,7 @@ class Series(commands.Cog):
         if match is None:
             return await ctx.respond(embed=error("Incorrect Google Drive folder URL."))
 
-        series_id = ctx.bot.database.series.new(group[0], series_name, drive_link, style_guide, mangadex, github_link, thumbnail)
+        series_id = await ctx.bot.database.series.new(group[0], series_name, drive_link, style_guide, mangadex, github_link, thumbnail)
         if not series_id:
             return await ctx.respond(embed=error(f"Failed to add new series `{series_name}` for group `{group_name}`."))
 
@@ -70,11 +70,11 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def delete(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list))):
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list)):
         await ctx.defer()
 
-        rows = ctx.bot.database.series.delete(group_name, series_name)
+        rows = await ctx.bot.database.series.delete(group_name, series_name)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Series `{series_name}` has been removed from Milize."))
 
@@ -83,10 +83,10 @@ class Series(commands.Cog):
     @Series.command(description="Lists all series of a group.")
     async def list(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list))):
+                    group_name: discord.Option(str, autocomplete=get_group_list)):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get_by_group_name(group_name)
+        series = await ctx.bot.database.series.get_by_group_name(group_name)
         
         output = []
         for i, (_, series_name, series_drive_link, style_guide, _, _) in enumerate(series, start=1):
@@ -107,8 +107,8 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def edit(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list),
                     new_name: str = None,
                     new_drive_link: str = None,
                     new_style_guide: str = None,
@@ -120,7 +120,7 @@ class Series(commands.Cog):
         if not new_name and not new_drive_link and not new_style_guide and not new_mangadex and not new_thumbnail and not new_github_link:
             return await ctx.respond(embed=error("You must provide at least one of `new_name`, `new_drive_link`, `new_style_guide`, `new_mangadex`, `new_github_link` or `new_thumbnail`."))
 
-        rows = ctx.bot.database.series.update(series_name, new_name, new_drive_link, new_style_guide, new_mangadex, new_github_link, new_thumbnail)
+        rows = await ctx.bot.database.series.update(series_name, new_name, new_drive_link, new_style_guide, new_mangadex, new_github_link, new_thumbnail)
 
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Series `{series_name}` has been updated."))
@@ -131,18 +131,18 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def move(self,
                     ctx,
-                    group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                    new_group: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list))):
+                    group_name: discord.Option(str, autocomplete=get_group_list),
+                    series_name: discord.Option(str, autocomplete=get_series_list),
+                    new_group: discord.Option(str, autocomplete=get_group_list)):
         await ctx.defer()
 
-        group_from = ctx.bot.database.groups.get_by_name(group_name)
-        group_to = ctx.bot.database.groups.get_by_name(new_group)
+        group_from = await ctx.bot.database.groups.get_by_name(group_name)
+        group_to = await ctx.bot.database.groups.get_by_name(new_group)
 
         if group_from.group_id == group_to.group_id:
             return await ctx.respond(embed=error(f"The series is already in `{group_from.group_name}`."))
 
-        rows = ctx.bot.database.series.move(group_from.group_id, group_to.group_id)
+        rows = await ctx.bot.database.series.move(group_from.group_id, group_to.group_id)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Series `{series_name}` has been moved to `{group_to.group_name}`."))
 
@@ -152,8 +152,8 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def add_github(self,
                          ctx,
-                         group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                         series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
+                         group_name: discord.Option(str, autocomplete=get_group_list),
+                         series_name: discord.Option(str, autocomplete=get_series_list),
                          title: str,
                          description: str,
                          artist: str,
@@ -161,7 +161,7 @@ class Series(commands.Cog):
                          cover: str):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error("Failed to get series."))
         
@@ -213,7 +213,7 @@ class Series(commands.Cog):
         update_response = requests.put(url, headers=headers, json=update_data)
         update_response.raise_for_status()
 
-        rows = ctx.bot.database.series.update(series_name=series_name, new_github_link=f"https://github.com/{owner}/{repo}/blob/{branch}/{file_name}")
+        rows = await ctx.bot.database.series.update(series_name=series_name, new_github_link=f"https://github.com/{owner}/{repo}/blob/{branch}/{file_name}")
         if rows is None:
             return await ctx.respond(embed=error("Failed to update database with the github link."))
 
@@ -223,16 +223,16 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def add_job(self,
                          ctx,
-                         group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                         series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                         job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_unadded_jobs))):
+                         group_name: discord.Option(str, autocomplete=get_group_list),
+                         series_name: discord.Option(str, autocomplete=get_series_list),
+                         job_name: discord.Option(str, autocomplete=get_unadded_jobs)):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if series is None:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}`."))
 
-        series_job_id = ctx.bot.database.jobs.add_to_series(series.series_id, job_name)
+        series_job_id = await ctx.bot.database.jobs.add_to_series(series.series_id, job_name)
         if series_job_id is None:
             return await ctx.respond(embed=error(f"Job `{job_name}` is already added to series `{series_name}` (or errored while adding.)"))
 
@@ -242,16 +242,16 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def remove_job(self,
                          ctx,
-                         group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                         series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                         job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs))):
+                         group_name: discord.Option(str, autocomplete=get_group_list),
+                         series_name: discord.Option(str, autocomplete=get_series_list),
+                         job_name: discord.Option(str, autocomplete=get_added_jobs)):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if series is None:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}`."))
 
-        rows = ctx.bot.database.jobs.remove_from_series(series.series_id, job_name)
+        rows = await ctx.bot.database.jobs.remove_from_series(series.series_id, job_name)
         if rows and rows > 0:
             return await ctx.respond(embed=info(f"Job `{job_name}` has been removed from series `{series_name}`."))
 
@@ -260,11 +260,11 @@ class Series(commands.Cog):
     @Series.command(description="Lists job attached to a series.")
     async def list_jobs(self,
                          ctx,
-                         group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                         series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list))):
+                         group_name: discord.Option(str, autocomplete=get_group_list),
+                         series_name: discord.Option(str, autocomplete=get_series_list)):
         await ctx.defer()
 
-        series_jobs = ctx.bot.database.jobs.get_added_all(series_name)
+        series_jobs = await ctx.bot.database.jobs.get_added_all(series_name)
 
         output = []
         for i, (_, _, job_name, role_id, _, _) in enumerate(series_jobs, start=1):
@@ -277,14 +277,14 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.ProjectManager)
     async def copy_jobs(self,
                     ctx,
-                    source_group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    source_series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list_by_source)),
-                    target_group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                    target_series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list_by_target))):
+                    source_group_name: discord.Option(str, autocomplete=get_group_list),
+                    source_series_name: discord.Option(str, autocomplete=get_series_list_by_source),
+                    target_group_name: discord.Option(str, autocomplete=get_group_list),
+                    target_series_name: discord.Option(str, autocomplete=get_series_list_by_target)):
         await ctx.defer()
 
-        source_series = ctx.bot.database.series.get(source_group_name, source_series_name)
-        target_series = ctx.bot.database.series.get(target_group_name, target_series_name)
+        source_series = await ctx.bot.database.series.get(source_group_name, source_series_name)
+        target_series = await ctx.bot.database.series.get(target_group_name, target_series_name)
 
         if not source_series:
             return await ctx.respond(embed=error(f"Source series `{source_series_name}` not found in group `{source_group_name}`."))
@@ -292,7 +292,7 @@ class Series(commands.Cog):
         if not target_series:
             return await ctx.respond(embed=error(f"Target series `{target_series_name}` not found in group `{target_group_name}`."))
 
-        jobs = ctx.bot.database.jobs.get_added_all(source_series_name)
+        jobs = await ctx.bot.database.jobs.get_added_all(source_series_name)
 
         if not jobs:
             return await ctx.respond(embed=error(f"No jobs found for source series `{source_series_name}`."))
@@ -300,7 +300,7 @@ class Series(commands.Cog):
         copied_jobs = 0
         for job in jobs:
             try:
-                new_job_id = ctx.bot.database.jobs.add_to_series(target_series.series_id, job.job_name)
+                new_job_id = await ctx.bot.database.jobs.add_to_series(target_series.series_id, job.job_name)
                 if new_job_id:
                     copied_jobs += 1
             except Exception as e:
@@ -315,22 +315,22 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.Owner)
     async def archive(self,
                       ctx,
-                      group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                      series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list))):
+                      group_name: discord.Option(str, autocomplete=get_group_list),
+                      series_name: discord.Option(str, autocomplete=get_series_list)):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` from `{group_name}`."))
 
         if series.is_archived:
             return await ctx.respond(embed=error(f"Series `{series_name}` is already archived."))
 
-        rows = ctx.bot.database.series.archive(series.series_id)
+        rows = await ctx.bot.database.series.archive(series.series_id)
         if rows is None:
             return await ctx.respond(embed=error(f"Failed to archive series `{series_name}`."))
 
-        rows = ctx.bot.database.chapters.archive_all(series.series_id)
+        rows = await ctx.bot.database.chapters.archive_all(series.series_id)
         if rows is None:
             return await ctx.respond(embed=error(f"Failed to archive all chapters for series `{series_name}`."))
 
@@ -339,8 +339,7 @@ class Series(commands.Cog):
         if series.series_drive_link:
             match = re.search(r'/folders/([a-zA-Z0-9_-]+)', series.series_drive_link)
             if match:
-                response = requests.get(f"{os.getenv('KeiretsuUrl')}/api/archive?id={match[1]}")
-                if response.status_code != 200:
+                if not await ctx.bot.keiretsu.archive(match[1]):
                     warning = '\n**Warning:** failed to move to `.archive(d)` folder in Google Drive.'
 
         await ctx.respond(embed=info(f"Series `{series_name}` from `{group_name}` has been archived." + warning))
@@ -349,18 +348,18 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.Owner)
     async def unarchive(self,
                       ctx,
-                      group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
+                      group_name: discord.Option(str, autocomplete=get_group_list),
                       series_name: str):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` from `{group_name}`."))
 
         if not series.is_archived:
             return await ctx.respond(embed=error(f"Series `{series_name}` is not archived."))
 
-        rows = ctx.bot.database.series.unarchive(series.series_id)
+        rows = await ctx.bot.database.series.unarchive(series.series_id)
         if rows is None:
             return await ctx.respond(embed=error(f"Failed to unarchive series `{series_name}`."))
 
@@ -368,7 +367,7 @@ class Series(commands.Cog):
         if series.series_drive_link:
             match = re.search(r'/folders/([a-zA-Z0-9_-]+)', series.series_drive_link)
             if match:
-                requests.get(f"{os.getenv('KeiretsuUrl')}/api/unarchive?id={match[1]}")
+                await ctx.bot.keiretsu.unarchive(match[1])
 
         await ctx.respond(embed=info(f"Series `{series_name}` from `{group_name}` has been unarchived."))
 
@@ -376,30 +375,30 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.Owner)
     async def assign(self,
                      ctx,
-                     group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                     series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                     job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs)),
+                     group_name: discord.Option(str, autocomplete=get_group_list),
+                     series_name: discord.Option(str, autocomplete=get_series_list),
+                     job_name: discord.Option(str, autocomplete=get_added_jobs),
                      user: discord.User):
         await ctx.defer()
 
         user_id = str(user.id)
-        member = ctx.bot.database.members.get(user_id)
+        member = await ctx.bot.database.members.get(user_id)
         if not member:
             return await ctx.respond(embed=error(f"{user.mention} is not added to members in Milize."))
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` for `{group_name}`."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if not series_job:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.series.get_assignment(series.series_id, series_job.series_job_id)
+        assignment = await ctx.bot.database.series.get_assignment(series.series_id, series_job.series_job_id)
         if assignment:
             return await ctx.respond(embed=error(f"Job is already assigned to <@{assignment.assigned_to}>. Cannot assign."))
 
-        assignment_id = ctx.bot.database.series.add_assignment(series.series_id, series_job.series_job_id, user_id)
+        assignment_id = await ctx.bot.database.series.add_assignment(series.series_id, series_job.series_job_id, user_id)
         if assignment_id is None:
             return await ctx.respond(embed=error(f"Failed to assign {user.mention} to job `{job_name}` for series `{series_name}`."))
 
@@ -409,24 +408,24 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.Owner)
     async def unassign(self,
                      ctx,
-                     group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                     series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
-                     job_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_added_jobs))):
+                     group_name: discord.Option(str, autocomplete=get_group_list),
+                     series_name: discord.Option(str, autocomplete=get_series_list),
+                     job_name: discord.Option(str, autocomplete=get_added_jobs)):
         await ctx.defer()
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` for `{group_name}`."))
 
-        series_job = ctx.bot.database.jobs.get_added(series_name, job_name)
+        series_job = await ctx.bot.database.jobs.get_added(series_name, job_name)
         if not series_job:
             return await ctx.respond(embed=error(f"Failed to get job `{job_name}` for series `{series_name}`."))
 
-        assignment = ctx.bot.database.series.get_assignment(series.series_id, series_job.series_job_id)
+        assignment = await ctx.bot.database.series.get_assignment(series.series_id, series_job.series_job_id)
         if not assignment:
             return await ctx.respond(embed=error(f"Job `{job_name}` for series `{series_name}` is not assigned to anyone."))
 
-        assignment_id = ctx.bot.database.series.remove_assignment(series.series_id, series_job.series_job_id)
+        assignment_id = await ctx.bot.database.series.remove_assignment(series.series_id, series_job.series_job_id)
         if assignment_id is None:
             return await ctx.respond(embed=error(f"Failed to remove assignment for job `{job_name}` for series `{series_name}`."))
 
@@ -437,8 +436,8 @@ class Series(commands.Cog):
     async def block_website(
         self,
         ctx,
-        group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-        series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
+        group_name: discord.Option(str, autocomplete=get_group_list),
+        series_name: discord.Option(str, autocomplete=get_series_list),
         website: discord.Option(str, description="Website to block.")
     ):
         await ctx.defer()
@@ -446,7 +445,7 @@ class Series(commands.Cog):
         if str(ctx.author.id) != os.getenv("DiscordDevId") and str(ctx.author.id) != os.getenv("DiscordOwnerId"):
             return await ctx.respond(embed=error("Not allowed. Ping owner or developer."))
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` for `{group_name}`."))
 
@@ -457,7 +456,7 @@ class Series(commands.Cog):
 
         blocked_websites.append(website)
 
-        updated = ctx.bot.database.series.update_blocked_websites(series_name, blocked_websites)
+        updated = await ctx.bot.database.series.update_blocked_websites(series_name, blocked_websites)
         if not updated:
             return await ctx.respond(embed=error("Failed to update blocked websites."))
 
@@ -468,8 +467,8 @@ class Series(commands.Cog):
     async def unblock_website(
         self,
         ctx,
-        group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-        series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list)),
+        group_name: discord.Option(str, autocomplete=get_group_list),
+        series_name: discord.Option(str, autocomplete=get_series_list),
         website: discord.Option(str, description="Website to unblock.")
     ):
         await ctx.defer()
@@ -477,7 +476,7 @@ class Series(commands.Cog):
         if str(ctx.author.id) != os.getenv("DiscordDevId") and str(ctx.author.id) != os.getenv("DiscordOwnerId"):
             return await ctx.respond(embed=error("Not allowed. Ping owner or developer."))
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if not series:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` for `{group_name}`."))
 
@@ -488,7 +487,7 @@ class Series(commands.Cog):
 
         blocked_websites.remove(website)
 
-        updated = ctx.bot.database.series.update_blocked_websites(series_name, blocked_websites)
+        updated = await ctx.bot.database.series.update_blocked_websites(series_name, blocked_websites)
         if not updated:
             return await ctx.respond(embed=error("Failed to update blocked websites."))
 
@@ -498,33 +497,33 @@ class Series(commands.Cog):
     @check_authority(AuthorityLevel.Member)
     async def assignments(self,
                           ctx,
-                          group_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_group_list)),
-                          series_name: discord.Option(str, autocomplete=discord.utils.basic_autocomplete(get_series_list))):
+                          group_name: discord.Option(str, autocomplete=get_group_list),
+                          series_name: discord.Option(str, autocomplete=get_series_list)):
         await ctx.defer()
 
         if not ctx.guild or ctx.guild.id != int(os.getenv("StaffGuildId")):
             return await ctx.respond(embed=error("This command is now deprecated. Please use `/chapter progress` to check the progress of a chapter."))
 
-        series = ctx.bot.database.series.get(group_name, series_name)
+        series = await ctx.bot.database.series.get(group_name, series_name)
         if series is None:
             return await ctx.respond(embed=error(f"Failed to get series `{series_name}` for group `{group_name}`."))
 
-        series_jobs = ctx.bot.database.jobs.get_added_all(series_name)
+        series_jobs = await ctx.bot.database.jobs.get_added_all(series_name)
         if series_jobs is None:
             return await ctx.respond(embed=error(f"Failed to get jobs for series `{series_name}`."))
 
         embed = discord.Embed(title="Consistent staff", url=series.series_drive_link, color=discord.Color.blue())
         embed.set_author(name=f"Jobs for {series_name} ({group_name})")
 
+        series_assignments = await ctx.bot.database.series.get_assignments(series.series_id) or []
+        users = await ctx.bot.user_resolver.resolve(assignment.assigned_to for assignment in series_assignments)
+
         for i, (series_job_id, job_id, job_name, _, _, _) in enumerate(series_jobs, start=1):
             field = ''
-            assignment = ctx.bot.database.series.get_assignment(series.series_id, series_job_id)
+            assignment = next((assignment for assignment in series_assignments if assignment.series_job_id == series_job_id), None)
 
             if assignment:
-                user = await ctx.bot.get_or_fetch_user(int(assignment.assigned_to))
-                member = ctx.bot.database.members.get(assignment.assigned_to)
-                display_name = "<unknown>" if not user else user.display_name
-                field = f"Assigned to: {display_name if member is None or member.credit_name is None else member.credit_name}"
+                field = f"Assigned to: {users[assignment.assigned_to].name}"
             else:
                 field = "Assigned to: None"
 
@@ -1,6 +1,4 @@
-import psycopg2
 import os
-from psycopg2.extras import NamedTupleCursor
 
 from utils.checks import check_connection
 
@@ -12,34 +10,43 @@ from .assignments import Assignments
 from .members import Members
 from .boardposts import Boardposts
 from .subscriptions import Subscriptions
+from .pool import ConnectionPool
+from .statements import PreparedConnection
+from .table import Table
 
-class DatabaseManager:
-    def __init__(self, database, host, user, password, port=5432):
-        try:
-            self.connection = psycopg2.connect(
-                database=database,
-                host=host,
-                user=user,
-                password=password,
-                port=port
-            )
-            self.cursor = self.connection.cursor(cursor_factory=NamedTupleCursor)
-            self.create_tables()
+class DatabaseManager(Table):
+    def __init__(self, database, host, user, password, port=5432, pool_size=10, idle_size=4):
+        # Idle connections are kept open (up to idle_size), along with the statements prepared on them.
+        super().__init__(ConnectionPool(
+            min(idle_size, pool_size),
+            pool_size,
+            on_connect=self.create_tables,
+            connection_factory=PreparedConnection,
+            database=database,
+            host=host,
+            user=user,
+            password=password,
+            port=port,
+            connect_timeout=10,
+            # Notices connections dropped by the network or the server instead of waiting on them forever.
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3
+        ))
 
-            self.groups = Groups(self.connection, self.cursor)
-            self.series = Series(self.connection, self.cursor)
-            self.chapters = Chapters(self.connection, self.cursor)
-            self.jobs = Jobs(self.connection, self.cursor)
-            self.assignments = Assignments(self.connection, self.cursor)
-            self.members = Members(self.connection, self.cursor)
-            self.boardposts = Boardposts(self.connection, self.cursor)
-            self.subscriptions = Subscriptions(self.connection, self.cursor)
+        # On failure the pool keeps reconnecting in the background, and creates the tables once it succeeds.
+        if self.pool.connect():
+            print(f"Connected to PostgreSQL (pool of up to {pool_size} connections).")
 
-            print("Connected to PostgreSQL.")
-        except Exception as e:
-            print(f"Failed to connect to PostgreSQL: {e}")
-            self.connection = None
-            self.cursor = None
+        self.groups = Groups(self.pool)
+        self.series = Series(self.pool)
+        self.chapters = Chapters(self.pool)
+        self.jobs = Jobs(self.pool)
+        self.assignments = Assignments(self.pool)
+        self.members = Members(self.pool)
+        self.boardposts = Boardposts(self.pool)
+        self.subscriptions = Subscriptions(self.pool)
 
     def create_tables(self):
         try:
@@ -1,11 +1,9 @@
 from utils.checks import check_connection
 from utils.constants import JobStatus
+from .statements import GET_ASSIGNMENT
+from .table import Table
 
-class Assignments:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Assignments(Table):
     @check_connection
     def new(self, chapter_id, series_job_id, user_id):
         try:
@@ -103,14 +101,58 @@ class Assignments:
     @check_connection
     def get(self, chapter_id, series_job_id):
         try:
-            self.cursor.execute("SELECT assignment_id, chapter_id, series_job_id, assigned_to, status, created_at, completed_at FROM jobsassignments WHERE chapter_id = %s AND series_job_id = %s", (chapter_id, series_job_id))
+            rows = self.execute_prepared(GET_ASSIGNMENT, chapter_id, series_job_id)
             self.connection.commit()
-            return self.cursor.fetchone()
+            return rows[0] if rows else None
         except Exception as e:
             self.connection.rollback()
             print(f"Failed to get job assignment for chapter id '{chapter_id}': {e}")
             return None
         
+    @check_connection
+    def get_stages(self, chapter_id):
+        try:
+            # Every job of the chapter's series, with its assignment on this chapter (if any) and whether the assignee wants stage notifications.
+            query = """
+            SELECT sj.series_job_id, j.job_id, j.job_name, j.job_type, ja.assignment_id, ja.assigned_to, ja.status, m.stage_notifications
+            FROM Chapters c
+            JOIN SeriesJobs sj ON sj.series_id = c.series_id
+            JOIN Jobs j ON j.job_id = sj.job_id
+            LEFT JOIN JobsAssignments ja ON ja.chapter_id = c.chapter_id AND ja.series_job_id = sj.series_job_id
+            LEFT JOIN Members m ON m.discord_id = ja.assigned_to
+            WHERE c.chapter_id = %s
+            ORDER BY sj.series_job_id;
+            """
+            self.cursor.execute(query, (chapter_id,))
+            self.connection.commit()
+            return self.cursor.fetchall()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to get job stages for chapter id '{chapter_id}': {e}")
+            return None
+
+    @check_connection
+    def get_stages_for_chapters(self, chapter_ids):
+        try:
+            # Same as get_stages, for several chapters at once.
+            query = """
+            SELECT c.chapter_id, sj.series_job_id, j.job_id, j.job_name, j.job_type, ja.assignment_id, ja.assigned_to, ja.status, m.stage_notifications
+            FROM Chapters c
+            JOIN SeriesJobs sj ON sj.series_id = c.series_id
+            JOIN Jobs j ON j.job_id = sj.job_id
+            LEFT JOIN JobsAssignments ja ON ja.chapter_id = c.chapter_id AND ja.series_job_id = sj.series_job_id
+            LEFT JOIN Members m ON m.discord_id = ja.assigned_to
+            WHERE c.chapter_id = ANY(%s)
+            ORDER BY c.chapter_id, sj.series_job_id;
+            """
+            self.cursor.execute(query, (list(chapter_ids),))
+            self.connection.commit()
+            return self.cursor.fetchall()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to get job stages for chapters {chapter_ids}: {e}")
+            return None
+
     @check_connection
     def get_all(self, chapter_id, series_job_id):
         try:
@@ -131,6 +173,46 @@ class Assignments:
             print(f"Failed to get job assignments for chapter id '{chapter_id}': {e}")
             return None
         
+    @check_connection
+    def find_for_user(self, user_id, series_name = None, chapter_name = None, job_name = None, completed = None):
+        # Latest of the user's assignments matching whatever was given, with its job, chapter and series names.
+        conditions = ["ja.assigned_to = %s"]
+        params = [user_id]
+
+        if series_name:
+            conditions.append("s.series_name = %s")
+            params.append(series_name)
+        if chapter_name:
+            conditions.append("c.chapter_name = %s")
+            params.append(str(chapter_name))
+        if job_name:
+            conditions.append("j.job_name = %s")
+            params.append(job_name)
+        if completed is not None:
+            conditions.append("ja.status = %s" if completed else "ja.status <> %s")
+            params.append(JobStatus.Completed)
+
+        try:
+            query = f"""
+                SELECT ja.assignment_id, ja.chapter_id, ja.series_job_id, ja.assigned_to, ja.status, ja.created_at, ja.completed_at,
+                    j.job_name, c.chapter_name, s.series_name
+                FROM JobsAssignments ja
+                JOIN SeriesJobs sj ON ja.series_job_id = sj.series_job_id
+                JOIN Jobs j ON sj.job_id = j.job_id
+                JOIN Chapters c ON ja.chapter_id = c.chapter_id
+                JOIN Series s ON c.series_id = s.series_id
+                WHERE {' AND '.join(conditions)}
+                ORDER BY COALESCE(ja.completed_at, ja.created_at) DESC
+                LIMIT 1
+            """
+            self.cursor.execute(query, tuple(params))
+            self.connection.commit()
+            return self.cursor.fetchone()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to find job assignment for user '{user_id}': {e}")
+            return None
+
     @check_connection
     def get_for_series(self, series_id):
         try:
@@ -207,6 +289,55 @@ class Assignments:
             print(f"Failed to update job status for chapter id '{chapter_id}': {e}")
             return None
 
+    @check_connection
+    def bulk_update_status(self, status, chapter_ids = None, series_id = None, chapter_names = None, user_id = None, series_job_ids = None):
+        # Every assignment matching the given filters in one statement. Completions made within 5 minutes of claiming aren't accounted, like in update_status.
+        conditions = ["ja.status <> %s"]
+        params = [status]
+
+        if chapter_ids is not None:
+            conditions.append("ja.chapter_id = ANY(%s)")
+            params.append(list(chapter_ids))
+        if series_id is not None:
+            conditions.append("c.series_id = %s")
+            params.append(series_id)
+        if chapter_names is not None:
+            conditions.append("c.chapter_name = ANY(%s)")
+            params.append([str(name) for name in chapter_names])
+        if user_id is not None:
+            conditions.append("ja.assigned_to = %s")
+            params.append(str(user_id))
+        if series_job_ids is not None:
+            conditions.append("ja.series_job_id = ANY(%s)")
+            params.append(list(series_job_ids))
+
+        if len(conditions) == 1:
+            print("Refusing to update job status without any filter.")
+            return None
+
+        if status == JobStatus.Completed:
+            updates = "status = %s, completed_at = CURRENT_TIMESTAMP, account = ja.created_at < CURRENT_TIMESTAMP - INTERVAL '5 minutes'"
+        else:
+            updates = "status = %s"
+
+        try:
+            query = f"""
+                UPDATE JobsAssignments ja
+                SET {updates}
+                FROM Chapters c, SeriesJobs sj, Jobs j
+                WHERE ja.chapter_id = c.chapter_id AND ja.series_job_id = sj.series_job_id AND sj.job_id = j.job_id
+                    AND {' AND '.join(conditions)}
+                RETURNING ja.assignment_id, ja.chapter_id, c.chapter_name, ja.series_job_id, j.job_name, j.job_type, ja.assigned_to, ja.account
+            """
+            self.cursor.execute(query, (status, *params))
+            updated = self.cursor.fetchall()
+            self.connection.commit()
+            return updated
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to bulk update job status to '{status}': {e}")
+            return None
+
     @check_connection
     def update_available(self, assignment_id):
         try:
@@ -217,6 +348,17 @@ class Assignments:
             self.connection.rollback()
             print(f"Failed to update 'available_at' for assignment '{assignment_id}': {e}") 
 
+    @check_connection
+    def update_notified(self, assignment_ids):
+        try:
+            self.cursor.execute("UPDATE jobsassignments SET available_at = CURRENT_TIMESTAMP, reminded_at = CURRENT_TIMESTAMP WHERE assignment_id = ANY(%s)", (assignment_ids,))
+            self.connection.commit()
+            return self.cursor.rowcount
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to update 'available_at' for assignments {assignment_ids}: {e}")
+            return None
+
     @check_connection
     def update_user(self, assignment_id, user_id):
         try:
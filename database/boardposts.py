@@ -1,10 +1,7 @@
 from utils.checks import check_connection
+from .table import Table
 
-class Boardposts:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Boardposts(Table):
     @check_connection
     def new(self, message_id, chapter_id, series_job_id, min_level):
         try:
@@ -0,0 +1,39 @@
+import time
+import threading
+
+class NameCache:
+    """
+    Pre-sorted name lists (as search indexes) for autocomplete and the rendered assistant prompt, keyed
+    by kind ("groups", "series", "chapters", ...) and the parent name they belong to. Entries expire after
+    `ttl` and are invalidated by the write methods that change them, which run on pool threads, hence the lock.
+    """
+
+    def __init__(self, ttl = 300.0):
+        self.ttl = ttl
+        self.entries = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def get(self, kind, key = None):
+        entry = self.entries.get((kind, key))
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
+        return None
+
+    def set(self, kind, key, names, generation):
+        # A load that raced with a write would cache what the write just changed, so it's dropped instead.
+        with self.lock:
+            if generation == self.generation:
+                self.entries[(kind, key)] = (names, time.monotonic() + self.ttl)
+
+    def invalidate(self, kind, key = None):
+        """Drops one entry, or every entry of `kind` when no key is given."""
+        with self.lock:
+            self.generation += 1
+            if key is None:
+                self.entries = { entry_key: entry for entry_key, entry in self.entries.items() if entry_key[0] != kind }
+            else:
+                self.entries.pop((kind, key), None)
+
+names = NameCache()
@@ -1,10 +1,10 @@
 from utils.checks import check_connection
+from utils.constants import UploadStatus
+from .statements import GET_CHAPTER
+from .table import Table
+from .cache import names
 
-class Chapters:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Chapters(Table):
     @check_connection
     def new(self, series_name, chapter_name, drive_link = None):
         try:
@@ -19,6 +19,7 @@ class Chapters:
             """
             self.cursor.execute(query, (series_name, chapter_name, drive_link))
             self.connection.commit()
+            names.invalidate("chapters", series_name)
 
             chapter_id = self.cursor.fetchone()
 
@@ -31,6 +32,49 @@ class Chapters:
             print(f"Failed to add chapter '{chapter_name}' for series '{series_name}': {e}")
             return None
         
+    @check_connection
+    def new_many(self, series_name, chapters):
+        """
+        Adds `chapters` (name and drive link pairs) to a series together with the series' consistent staff
+        assignments for each of them, in a single statement. Returns the chapters that were created, with
+        how many assignments each got; names already in the series are skipped.
+        """
+        chapter_names = [chapter_name for chapter_name, _ in chapters]
+        drive_links = [drive_link for _, drive_link in chapters]
+
+        try:
+            query = """
+            WITH series_cte AS (
+                SELECT series_id FROM series WHERE series_name = %s
+            ),
+            new_chapters AS (
+                INSERT INTO chapters (series_id, chapter_name, drive_link)
+                SELECT s.series_id, c.chapter_name, c.drive_link
+                FROM series_cte s, unnest(%s::VARCHAR[], %s::VARCHAR[]) AS c(chapter_name, drive_link)
+                ON CONFLICT (series_id, chapter_name) DO NOTHING
+                RETURNING chapter_id, chapter_name, series_id
+            ),
+            new_assignments AS (
+                INSERT INTO jobsassignments (chapter_id, series_job_id, assigned_to)
+                SELECT nc.chapter_id, sa.series_job_id, sa.assigned_to
+                FROM new_chapters nc
+                JOIN seriesassignments sa ON sa.series_id = nc.series_id
+                ON CONFLICT (chapter_id, series_job_id) DO NOTHING
+                RETURNING chapter_id
+            )
+            SELECT nc.chapter_id, nc.chapter_name, (SELECT COUNT(*) FROM new_assignments na WHERE na.chapter_id = nc.chapter_id) AS assignments
+            FROM new_chapters nc;
+            """
+            self.cursor.execute(query, (series_name, chapter_names, drive_links))
+            created = self.cursor.fetchall()
+            self.connection.commit()
+            names.invalidate("chapters", series_name)
+            return created
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to add chapters {chapter_names} for series '{series_name}': {e}")
+            return None
+
     @check_connection
     def new_upload_schedule(
         self,
@@ -50,25 +94,32 @@ class Chapters:
         chapter_id: int
     ):
         try:
+            # The per-website jobs are created in the same statement, so a schedule never exists without them.
             query = """
-            INSERT INTO UploadSchedules (
-                volume_number,
-                chapter_number,
-                language,
-                chapter_name,
-                group_ids,
-                series_id,
-                folder_name,
-                upload_time,
-                discord_id,
-                series_name,
-                group_name,
-                github_link,
-                upload_websites,
-                chapter_id
+            WITH schedule AS (
+                INSERT INTO UploadSchedules (
+                    volume_number,
+                    chapter_number,
+                    language,
+                    chapter_name,
+                    group_ids,
+                    series_id,
+                    folder_name,
+                    upload_time,
+                    discord_id,
+                    series_name,
+                    group_name,
+                    github_link,
+                    upload_websites,
+                    chapter_id
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                RETURNING upload_id, upload_websites
+            ), websites AS (
+                INSERT INTO UploadScheduleWebsites (upload_id, website)
+                SELECT upload_id, unnest(upload_websites) FROM schedule
             )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING upload_id;
+            SELECT upload_id FROM schedule;
             """
             self.cursor.execute(query, (
                 volume_number,
@@ -99,22 +150,173 @@ class Chapters:
             return None
         
     @check_connection
-    def get_active_scheduled_upload(self):
+    def claim_scheduled_uploads(self, limit: int, lease_seconds: int):
         try:
+            # Due uploads, plus running ones whose worker stopped sending heartbeats (crash or restart).
             query = """
-            SELECT *
-            FROM uploadschedules
-            WHERE upload_time <= NOW()
-            ORDER BY upload_time ASC
-            LIMIT 1;
+            UPDATE UploadSchedules
+            SET status = %s, heartbeat_at = NOW()
+            WHERE upload_id IN (
+                SELECT upload_id
+                FROM UploadSchedules
+                WHERE upload_time <= NOW()
+                AND (status = %s OR (status = %s AND heartbeat_at < NOW() - make_interval(secs => %s)))
+                ORDER BY upload_time ASC
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING *;
             """
-            self.cursor.execute(query)
-            result = self.cursor.fetchone()
-            return result
+            self.cursor.execute(query, (UploadStatus.Running, UploadStatus.Pending, UploadStatus.Running, lease_seconds, limit))
+            self.connection.commit()
+            return self.cursor.fetchall()
         except Exception as e:
-            print(f"Failed to fetch scheduled upload: {e}")
-            return None
-        
+            self.connection.rollback()
+            print(f"Failed to claim scheduled uploads: {e}")
+            return []
+
+    @check_connection
+    def touch_scheduled_uploads(self, upload_ids: list[int]):
+        try:
+            query = "UPDATE UploadSchedules SET heartbeat_at = NOW() WHERE upload_id = ANY(%s) AND status = %s;"
+            self.cursor.execute(query, (upload_ids, UploadStatus.Running))
+            self.connection.commit()
+            return self.cursor.rowcount
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to update heartbeat of scheduled uploads {upload_ids}: {e}")
+            return 0
+
+    @check_connection
+    def set_upload_schedule_status(self, upload_id: int, status: int):
+        try:
+            self.cursor.execute("UPDATE UploadSchedules SET status = %s WHERE upload_id = %s;", (status, upload_id))
+            self.connection.commit()
+            return self.cursor.rowcount > 0
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to update status of upload schedule with ID {upload_id}: {e}")
+            return False
+
+    @check_connection
+    def retry_upload_schedule(self, upload_id: int):
+        try:
+            query = "UPDATE UploadSchedules SET status = %s, heartbeat_at = NULL WHERE upload_id = %s AND status = %s;"
+            self.cursor.execute(query, (UploadStatus.Pending, upload_id, UploadStatus.Failed))
+            if self.cursor.rowcount == 0:
+                self.connection.rollback()
+                return False
+
+            query = "UPDATE UploadScheduleWebsites SET status = %s, updated_at = NOW() WHERE upload_id = %s AND status <> %s;"
+            self.cursor.execute(query, (UploadStatus.Pending, upload_id, UploadStatus.Completed))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to retry upload schedule with ID {upload_id}: {e}")
+            return False
+
+    @check_connection
+    def get_upload_websites(self, upload_id: int):
+        try:
+            # Schedules created before per-website jobs existed get theirs on first use.
+            self.cursor.execute("""
+            INSERT INTO UploadScheduleWebsites (upload_id, website)
+            SELECT upload_id, unnest(upload_websites) FROM UploadSchedules WHERE upload_id = %s
+            ON CONFLICT DO NOTHING;
+            """, (upload_id,))
+
+            query = """
+            SELECT w.website, w.status, w.url, w.session_id, w.commit_started_at, w.committed_id
+            FROM UploadScheduleWebsites w
+            JOIN UploadSchedules s ON s.upload_id = w.upload_id
+            WHERE w.upload_id = %s
+            ORDER BY array_position(s.upload_websites, w.website);
+            """
+            self.cursor.execute(query, (upload_id,))
+            self.connection.commit()
+            return self.cursor.fetchall()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to fetch websites of upload schedule with ID {upload_id}: {e}")
+            return []
+
+    @check_connection
+    def set_upload_website_status(self, upload_id: int, website: str, status: int, url: str = None):
+        try:
+            query = """
+            UPDATE UploadScheduleWebsites
+            SET status = %s, url = COALESCE(%s, url), updated_at = NOW()
+            WHERE upload_id = %s AND website = %s;
+            """
+            self.cursor.execute(query, (status, url, upload_id, website))
+            self.connection.commit()
+            return self.cursor.rowcount > 0
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to update '{website}' status of upload schedule with ID {upload_id}: {e}")
+            return False
+
+    @check_connection
+    def set_upload_session(self, upload_id: int, website: str, session_id: str):
+        try:
+            # A new session means the pages checkpointed for the old one are gone.
+            self.cursor.execute("DELETE FROM UploadSchedulePages WHERE upload_id = %s AND website = %s;", (upload_id, website))
+            self.cursor.execute("UPDATE UploadScheduleWebsites SET session_id = %s, commit_started_at = NULL, updated_at = NOW() WHERE upload_id = %s AND website = %s;", (session_id, upload_id, website))
+            self.connection.commit()
+            return self.cursor.rowcount > 0
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to save '{website}' session of upload schedule with ID {upload_id}: {e}")
+            return False
+
+    @check_connection
+    def set_upload_commit(self, upload_id: int, website: str, committed_id: str = None):
+        try:
+            # Without an ID, marks the commit as sent. With one, records the chapter it created.
+            if committed_id is None:
+                query = "UPDATE UploadScheduleWebsites SET commit_started_at = NOW(), updated_at = NOW() WHERE upload_id = %s AND website = %s;"
+                self.cursor.execute(query, (upload_id, website))
+            else:
+                query = "UPDATE UploadScheduleWebsites SET committed_id = %s, updated_at = NOW() WHERE upload_id = %s AND website = %s;"
+                self.cursor.execute(query, (committed_id, upload_id, website))
+            self.connection.commit()
+            return self.cursor.rowcount > 0
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to save '{website}' commit of upload schedule with ID {upload_id}: {e}")
+            return False
+
+    @check_connection
+    def get_upload_pages(self, upload_id: int, website: str):
+        try:
+            query = "SELECT filename, remote_id FROM UploadSchedulePages WHERE upload_id = %s AND website = %s;"
+            self.cursor.execute(query, (upload_id, website))
+            self.connection.commit()
+            return { page.filename: page.remote_id for page in self.cursor.fetchall() }
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to fetch '{website}' pages of upload schedule with ID {upload_id}: {e}")
+            return {}
+
+    @check_connection
+    def save_upload_pages(self, upload_id: int, website: str, pages: dict[str, str]):
+        try:
+            query = """
+            INSERT INTO UploadSchedulePages (upload_id, website, filename, remote_id)
+            SELECT %s, %s, filename, remote_id
+            FROM unnest(%s::varchar[], %s::varchar[]) AS pages(filename, remote_id)
+            ON CONFLICT (upload_id, website, filename)
+            DO UPDATE SET remote_id = EXCLUDED.remote_id, uploaded_at = NOW();
+            """
+            self.cursor.execute(query, (upload_id, website, list(pages.keys()), list(pages.values())))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to save '{website}' pages of upload schedule with ID {upload_id}: {e}")
+            return False
+
     @check_connection
     def get_scheduled_upload_by_chapter(self, chapter_id):
         try:
@@ -141,6 +343,19 @@ class Chapters:
             print(f"Failed to fetch scheduled upload: {e}")
             return None
         
+    @check_connection
+    def cancel_upload_schedule(self, upload_id: int):
+        try:
+            # Only deletes uploads the scheduler isn't running, checked in the same statement so it can't claim it in between.
+            query = "DELETE FROM uploadschedules WHERE upload_id = %s AND status <> %s RETURNING folder_name;"
+            self.cursor.execute(query, (upload_id, UploadStatus.Running))
+            self.connection.commit()
+            return self.cursor.fetchone()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to cancel upload schedule with ID {upload_id}: {e}")
+            return None
+
     @check_connection
     def delete_upload_schedule(self, upload_id: int):
         try:
@@ -172,6 +387,7 @@ class Chapters:
             
             self.cursor.execute(query, (series_name, chapter_name))
             self.connection.commit()
+            names.invalidate("chapters", series_name)
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -206,6 +422,7 @@ class Chapters:
                 """
                 self.cursor.execute(query, tuple(params))
                 self.connection.commit()
+                names.invalidate("chapters", series_name)
                 return self.cursor.rowcount
             except Exception as e:
                 self.connection.rollback()
@@ -217,15 +434,9 @@ class Chapters:
     @check_connection
     def get(self, series_name, chapter_name):
         try:
-            query = """
-            SELECT c.chapter_id, c.chapter_name, c.drive_link, c.series_id, c.is_archived
-            FROM chapters c
-            JOIN series s ON c.series_id = s.series_id
-            WHERE s.series_name = %s AND c.chapter_name = %s;
-            """
-            self.cursor.execute(query, (series_name, chapter_name))
+            rows = self.execute_prepared(GET_CHAPTER, series_name, str(chapter_name))
             self.connection.commit()
-            return self.cursor.fetchone()
+            return rows[0] if rows else None
         except Exception as e:
             self.connection.rollback()
             print(f"Failed to get chapter '{chapter_name}' for series '{series_name}': {e}")
@@ -242,6 +453,24 @@ class Chapters:
             print(f"Failed to get chapter with ID '{chapter_id}': {e}")
             return None
 
+    @check_connection
+    def get_names(self, series_name):
+        try:
+            # Every chapter name of the series, archived ones included.
+            query = """
+            SELECT c.chapter_name
+            FROM Chapters c
+            JOIN Series s ON c.series_id = s.series_id
+            WHERE s.series_name = %s;
+            """
+            self.cursor.execute(query, (series_name,))
+            self.connection.commit()
+            return { chapter.chapter_name for chapter in self.cursor.fetchall() }
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to list chapter names for series '{series_name}': {e}")
+            return None
+
     @check_connection
     def get_by_series_name(self, series_name):
         try:
@@ -264,6 +493,7 @@ class Chapters:
         try:
             self.cursor.execute("UPDATE chapters SET is_archived = TRUE WHERE chapter_id = %s;", (chapter_id,))
             self.connection.commit()
+            names.invalidate("chapters")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -275,6 +505,7 @@ class Chapters:
         try:
             self.cursor.execute("UPDATE chapters SET is_archived = FALSE WHERE chapter_id = %s;", (chapter_id,))
             self.connection.commit()
+            names.invalidate("chapters")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -286,6 +517,7 @@ class Chapters:
         try:
             self.cursor.execute("UPDATE chapters SET is_archived = TRUE WHERE series_id = %s;", (series_id,))
             self.connection.commit()
+            names.invalidate("chapters")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -1,15 +1,14 @@
 from utils.checks import check_connection
+from .table import Table
+from .cache import names
 
-class Groups:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Groups(Table):
     @check_connection
     def new(self, name, discord, website, creator_id):
         try:
             self.cursor.execute("INSERT INTO groups (group_name, discord, website, creator_id) VALUES (%s, %s, %s, %s) ON CONFLICT (group_name) DO NOTHING RETURNING group_id;", (name, discord, website, creator_id))
             self.connection.commit()
+            names.invalidate("groups")
 
             group_id = self.cursor.fetchone()
 
@@ -29,6 +28,12 @@ class Groups:
         try:
             self.cursor.execute("DELETE FROM groups WHERE group_name = %s", (group_name,))
             self.connection.commit()
+            names.invalidate("groups")
+            names.invalidate("series", group_name)
+            names.invalidate("chapters")
+            names.invalidate("added_jobs")
+            names.invalidate("unadded_jobs")
+            names.invalidate("ai_context")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -78,6 +83,8 @@ class Groups:
             try:
                 self.cursor.execute(f"UPDATE groups SET {', '.join(updates)} WHERE group_name = %s", tuple(params))
                 self.connection.commit()
+                names.invalidate("groups")
+                names.invalidate("series", group_name)
                 return self.cursor.rowcount
             except Exception as e:
                 self.connection.rollback()
@@ -1,15 +1,17 @@
 from utils.checks import check_connection
+from .statements import GET_ADDED_JOB
+from .table import Table
+from .cache import names
 
-class Jobs:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Jobs(Table):
     @check_connection
     def new(self, job_name, role_id, job_type, creator_id):
         try:
             self.cursor.execute("INSERT INTO jobs (job_name, role_id, job_type, creator_id) VALUES (%s, %s, %s, %s) ON CONFLICT (job_name) DO NOTHING RETURNING job_id;", (job_name, role_id, job_type, creator_id))
             self.connection.commit()
+            names.invalidate("jobs")
+            names.invalidate("unadded_jobs")
+            names.invalidate("ai_context")
 
             job_id = self.cursor.fetchone()
 
@@ -30,6 +32,10 @@ class Jobs:
         try:
             self.cursor.execute("UPDATE jobs SET role_id = %s, job_type = %s, job_name = %s WHERE job_name = %s", (role_id, job_type, updated_job_name, job_name))
             self.connection.commit()
+            names.invalidate("jobs")
+            names.invalidate("added_jobs")
+            names.invalidate("unadded_jobs")
+            names.invalidate("ai_context")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -41,6 +47,10 @@ class Jobs:
         try:
             self.cursor.execute("DELETE FROM jobs WHERE job_name = %s", (job_name,))
             self.connection.commit()
+            names.invalidate("jobs")
+            names.invalidate("added_jobs")
+            names.invalidate("unadded_jobs")
+            names.invalidate("ai_context")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -83,6 +93,8 @@ class Jobs:
 
             self.cursor.execute(query, (series_id, job_name))
             self.connection.commit()
+            names.invalidate("added_jobs")
+            names.invalidate("unadded_jobs")
 
             series_jobs_id = self.cursor.fetchone()
 
@@ -109,6 +121,8 @@ class Jobs:
 
             self.cursor.execute(query, (series_id, job_name))
             self.connection.commit()
+            names.invalidate("added_jobs")
+            names.invalidate("unadded_jobs")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -176,17 +190,9 @@ class Jobs:
     @check_connection
     def get_added(self, series_name, job_name):
         try:
-            query = """
-            SELECT sj.series_job_id, j.job_id, j.job_name, j.role_id, j.creator_id, j.job_type
-            FROM Jobs j
-            INNER JOIN SeriesJobs sj ON j.job_id = sj.job_id
-            INNER JOIN Series s ON sj.series_id = s.series_id
-            WHERE s.series_name = %s AND j.job_name = %s;
-            """
-            
-            self.cursor.execute(query, (series_name, job_name))
+            rows = self.execute_prepared(GET_ADDED_JOB, series_name, job_name)
             self.connection.commit()
-            return self.cursor.fetchone()
+            return rows[0] if rows else None
         except Exception as e:
             self.connection.rollback()
             print(f"Failed to get attached jobs for series '{series_name}': {e}")
@@ -1,10 +1,8 @@
 from utils.checks import check_connection
+from .statements import GET_AUTHORITY
+from .table import Table
 
-class Members:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Members(Table):
     @check_connection
     def add(self, user_id, authority):
         try:
@@ -42,6 +40,61 @@ class Members:
             print(f"Failed to get all members: {e}")
             return None
 
+    @check_connection
+    def get_credit_names(self, user_ids):
+        try:
+            self.cursor.execute("SELECT discord_id, credit_name FROM members WHERE discord_id = ANY(%s)", (list(user_ids),))
+            return { row.discord_id: row.credit_name for row in self.cursor.fetchall() }
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to get credit names: {e}")
+            return None
+
+    @check_connection
+    def get_jobboard_recipients(self, series_id):
+        # Discord IDs of members pinged for new posts, either for every series or because they follow this one.
+        try:
+            query = """
+                SELECT m.discord_id
+                FROM Members m
+                WHERE m.jobboard_notifications
+                    OR EXISTS (SELECT 1 FROM SeriesSubscriptions ss WHERE ss.member_id = m.member_id AND ss.series_id = %s)
+            """
+            self.cursor.execute(query, (series_id,))
+            return { row.discord_id for row in self.cursor.fetchall() }
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to get job board recipients for series '{series_id}': {e}")
+            return None
+
+    @check_connection
+    def get_inactive(self, min_days):
+        # Members without unfinished assignments whose last completed job (or join date) is at least `min_days` old.
+        try:
+            query = """
+                SELECT m.*, COALESCE(a.last_completed_at, m.created_at) AS last_active_at
+                FROM Members m
+                LEFT JOIN MemberActivity a ON a.discord_id = m.discord_id
+                WHERE COALESCE(a.active_assignments, 0) = 0
+                    AND COALESCE(a.last_completed_at, m.created_at) <= NOW() - make_interval(days => %s)
+            """
+            self.cursor.execute(query, (min_days,))
+            return self.cursor.fetchall()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to get inactive members: {e}")
+            return None
+
+    @check_connection
+    def get_activity(self, user_id):
+        try:
+            self.cursor.execute("SELECT discord_id, active_assignments, total_completed, last_completed_at FROM MemberActivity WHERE discord_id = %s", (user_id,))
+            return self.cursor.fetchone()
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Failed to get activity for user '{user_id}': {e}")
+            return None
+
     @check_connection
     def delete(self, user_id):
         try:
@@ -117,12 +170,11 @@ class Members:
     @check_connection
     def get_authority(self, user_id):
         try:
-            self.cursor.execute("SELECT authority_level FROM members WHERE discord_id = %s", (user_id,))
+            rows = self.execute_prepared(GET_AUTHORITY, str(user_id))
             self.connection.commit()
-            result = self.cursor.fetchone()
 
-            if result:
-                return result[0]
+            if rows:
+                return rows[0][0]
 
             return None
         except Exception as e:
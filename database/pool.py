@@ -0,0 +1,190 @@
+import asyncio
+import random
+import threading
+import time
+import psycopg2
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from psycopg2 import extensions
+from psycopg2.pool import ThreadedConnectionPool, PoolError
+from psycopg2.extras import NamedTupleCursor
+
+class ConnectionPool:
+    """
+    Pool of PostgreSQL connections shared by all table classes.
+
+    Queries are run on a dedicated thread pool sized to the number of connections,
+    so a checkout never waits on an exhausted pool and the event loop is never blocked.
+
+    Connections are validated on checkout and reset on checkin, and dead ones are dropped. Whenever
+    no working connection can be had, a supervisor thread reconnects with exponential backoff while
+    the tables report no connection instead of erroring.
+    """
+
+    def __init__(self, min_connections, max_connections, on_connect = None, idle_check = 30.0, max_backoff = 60.0, **connect_kwargs):
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.connect_kwargs = connect_kwargs
+        self.on_connect = on_connect
+        # Connections idle for longer than this are pinged before use.
+        self.idle_check = idle_check
+        self.max_backoff = max_backoff
+
+        self.pool = None
+        self.healthy = False
+        self.initialized = False
+        self.last_used = {}
+
+        self.lock = threading.Lock()
+        self.closed = threading.Event()
+        self.supervisor = None
+
+        self.executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="milize-db")
+        self.local = threading.local()
+
+    def __bool__(self):
+        if not self.healthy:
+            self.supervise()
+        return self.healthy
+
+    def connect(self):
+        try:
+            self._connect()
+            return True
+        except psycopg2.Error as e:
+            print(f"Failed to connect to PostgreSQL: {e}")
+            self.supervise()
+            return False
+
+    def _connect(self):
+        if self.pool is None:
+            self.pool = ThreadedConnectionPool(self.min_connections, self.max_connections, **self.connect_kwargs)
+
+        connection = self.checkout()
+        if self.on_connect and not self.initialized:
+            self.execute(connection, self.on_connect)
+            self.initialized = True
+        else:
+            self.checkin(connection)
+
+        self.healthy = True
+
+    def supervise(self):
+        with self.lock:
+            if self.closed.is_set() or (self.supervisor and self.supervisor.is_alive()):
+                return
+
+            self.healthy = False
+            self.supervisor = threading.Thread(target=self._reconnect, name="milize-db-supervisor", daemon=True)
+            self.supervisor.start()
+
+    def _reconnect(self):
+        delay = 1.0
+        while not self.closed.wait(delay + random.uniform(0, delay / 2)):
+            try:
+                self._connect()
+                print("Reconnected to PostgreSQL.")
+                return
+            except psycopg2.Error as e:
+                print(f"Failed to reconnect to PostgreSQL: {e}")
+
+            delay = min(delay * 2, self.max_backoff)
+
+    def checkout(self):
+        if self.pool is None:
+            raise psycopg2.OperationalError("not connected")
+
+        # Every connection in the pool may have died with the server, so try until a new one has to be opened.
+        for _ in range(self.max_connections + 1):
+            connection = self.pool.getconn()
+            if self.validate(connection):
+                return connection
+
+            self.discard(connection)
+
+        raise psycopg2.OperationalError("no usable connection in the pool")
+
+    def validate(self, connection):
+        if connection.closed:
+            return False
+
+        status = connection.info.transaction_status
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        try:
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                # Aborted or left open by an earlier call.
+                connection.rollback()
+            elif time.monotonic() - self.last_used.get(id(connection), time.monotonic()) > self.idle_check:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def checkin(self, connection):
+        if not connection.closed and connection.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            # Rolls back anything left open by read-only queries that never commit. psycopg2 would do this
+            # as well, but loses track of the connection when the rollback fails.
+            try:
+                connection.rollback()
+            except psycopg2.Error:
+                pass
+
+        if connection.closed or connection.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            self.discard(connection)
+            return
+
+        self.last_used[id(connection)] = time.monotonic()
+        self.pool.putconn(connection)
+
+    def discard(self, connection):
+        self.last_used.pop(id(connection), None)
+        try:
+            self.pool.putconn(connection, close=True)
+        except psycopg2.Error:
+            pass
+
+    def execute(self, connection, func, *args, **kwargs):
+        cursor = connection.cursor(cursor_factory=NamedTupleCursor)
+
+        self.local.connection = connection
+        self.local.cursor = cursor
+        try:
+            return func(*args, **kwargs)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # The connection went away mid-call, usually while rolling back after the query itself failed.
+            print(f"Lost connection to PostgreSQL: {e}")
+            return None
+        finally:
+            self.local.connection = None
+            self.local.cursor = None
+
+            if not connection.closed:
+                cursor.close()
+            self.checkin(connection)
+
+    def call(self, func, *args, **kwargs):
+        try:
+            connection = self.checkout()
+        except PoolError as e:
+            print(f"No free connection to the database: {e}")
+            return None
+        except psycopg2.Error as e:
+            print(f"No connection to the database: {e}")
+            self.supervise()
+            return None
+
+        return self.execute(connection, func, *args, **kwargs)
+
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(self.call, func, *args, **kwargs))
+
+    def close(self):
+        self.closed.set()
+        self.executor.shutdown(wait=True)
+        if self.pool:
+            self.pool.closeall()
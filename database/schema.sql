@@ -149,6 +149,40 @@ CREATE TABLE IF NOT EXISTS UploadSchedules (
     chapter_id INT REFERENCES Chapters(chapter_id) ON DELETE CASCADE
 );
 
+-- 0: Pending, 1: Running, 2: Completed, 3: Failed. Running rows whose heartbeat stops are reclaimed.
+ALTER TABLE UploadSchedules ADD COLUMN IF NOT EXISTS status INT NOT NULL DEFAULT 0;
+ALTER TABLE UploadSchedules ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS upload_schedules_due_idx ON UploadSchedules (upload_time) WHERE status IN (0, 1);
+
+-- Upload Scheduler Per-Website Jobs Table
+CREATE TABLE IF NOT EXISTS UploadScheduleWebsites (
+    upload_id INT REFERENCES UploadSchedules(upload_id) ON DELETE CASCADE,
+    website VARCHAR(100) NOT NULL,
+    status INT NOT NULL DEFAULT 0,
+    url VARCHAR(255),
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (upload_id, website)
+);
+
+-- MangaDex upload session the website's pages went into, so it can be resumed after a restart.
+ALTER TABLE UploadScheduleWebsites ADD COLUMN IF NOT EXISTS session_id VARCHAR(100);
+
+-- When the session was sent to be committed, and the chapter it became, so a chapter is never uploaded twice.
+ALTER TABLE UploadScheduleWebsites ADD COLUMN IF NOT EXISTS commit_started_at TIMESTAMPTZ;
+ALTER TABLE UploadScheduleWebsites ADD COLUMN IF NOT EXISTS committed_id VARCHAR(100);
+
+-- Upload Scheduler Page Checkpoints Table (MangaDex session file ID or catbox URL per page)
+CREATE TABLE IF NOT EXISTS UploadSchedulePages (
+    upload_id INT NOT NULL,
+    website VARCHAR(100) NOT NULL,
+    filename VARCHAR(255) NOT NULL,
+    remote_id VARCHAR(255) NOT NULL,
+    uploaded_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (upload_id, website, filename),
+    FOREIGN KEY (upload_id, website) REFERENCES UploadScheduleWebsites(upload_id, website) ON DELETE CASCADE
+);
+
 -- ======================================================================
 -- ==================== DATA ARCHIVE AFTER THIS LINE ====================
 -- ======================================================================
@@ -247,4 +281,101 @@ BEGIN
         EXECUTE FUNCTION archive_members();
     END IF;
 END;
-$$ LANGUAGE plpgsql;
\ No newline at end of file
+$$ LANGUAGE plpgsql;
+
+-- ======================================================================
+-- ==================== ACTIVITY SUMMARY AFTER THIS LINE ================
+-- ======================================================================
+-- Per-user totals over live and archived assignments, so profile and inactivity checks read one row.
+CREATE TABLE IF NOT EXISTS MemberActivity (
+    discord_id VARCHAR(100) PRIMARY KEY,
+    active_assignments INT NOT NULL DEFAULT 0,
+    total_completed INT NOT NULL DEFAULT 0,
+    last_completed_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS jobs_assignments_assigned_to_idx ON JobsAssignments (assigned_to);
+CREATE INDEX IF NOT EXISTS jobs_assignments_archive_assigned_to_idx ON JobsAssignmentsArchive (assigned_to);
+
+-- Rebuilt from the user's own rows rather than adjusted by deltas, because archiving upserts and
+-- restores move rows between both tables.
+CREATE OR REPLACE FUNCTION refresh_member_activity(user_id VARCHAR) RETURNS VOID AS $$
+BEGIN
+    -- One refresh per user at a time, held until commit. The recount below then starts after the other
+    -- transaction committed and sees its changes, instead of overwriting them with an older snapshot.
+    PERFORM pg_advisory_xact_lock(hashtext('member_activity'), hashtext(user_id));
+
+    INSERT INTO MemberActivity (discord_id, active_assignments, total_completed, last_completed_at, updated_at)
+    SELECT
+        user_id,
+        (SELECT COUNT(*) FROM JobsAssignments WHERE assigned_to = user_id AND status <> 2),
+        (SELECT COUNT(*) FROM JobsAssignments WHERE assigned_to = user_id AND status = 2)
+            + (SELECT COUNT(*) FROM JobsAssignmentsArchive WHERE assigned_to = user_id AND status = 2),
+        GREATEST(
+            (SELECT MAX(completed_at) FROM JobsAssignments WHERE assigned_to = user_id),
+            (SELECT MAX(completed_at) FROM JobsAssignmentsArchive WHERE assigned_to = user_id)
+        ),
+        CURRENT_TIMESTAMP
+    ON CONFLICT (discord_id)
+    DO UPDATE SET
+        active_assignments = EXCLUDED.active_assignments,
+        total_completed = EXCLUDED.total_completed,
+        last_completed_at = EXCLUDED.last_completed_at,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION track_member_activity() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM refresh_member_activity(OLD.assigned_to);
+    END IF;
+
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.assigned_to IS DISTINCT FROM OLD.assigned_to) THEN
+        PERFORM refresh_member_activity(NEW.assigned_to);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_trigger
+        WHERE tgname = 'track_jobs_assignments_activity'
+    ) THEN
+        CREATE TRIGGER track_jobs_assignments_activity
+        AFTER INSERT OR DELETE OR UPDATE OF status, completed_at, assigned_to ON JobsAssignments
+        FOR EACH ROW
+        EXECUTE FUNCTION track_member_activity();
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_trigger
+        WHERE tgname = 'track_jobs_assignments_archive_activity'
+    ) THEN
+        CREATE TRIGGER track_jobs_assignments_archive_activity
+        AFTER INSERT OR DELETE OR UPDATE OF status, completed_at, assigned_to ON JobsAssignmentsArchive
+        FOR EACH ROW
+        EXECUTE FUNCTION track_member_activity();
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Fill the summary once for history recorded before it existed.
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM MemberActivity) THEN
+        PERFORM refresh_member_activity(assigned_to)
+        FROM (
+            SELECT assigned_to FROM JobsAssignments
+            UNION
+            SELECT assigned_to FROM JobsAssignmentsArchive
+        ) users;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
@@ -1,15 +1,15 @@
 from utils.checks import check_connection
+from .table import Table
+from .cache import names
 
-class Series:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Series(Table):
     @check_connection
     def new(self, group_id, name, drive_link, style_guide, mangadex, github_link, thumbnail):
         try:
             self.cursor.execute("INSERT INTO series (series_name, series_drive_link, style_guide, group_id, mangadex, github_link, thumbnail) VALUES (%s, %s, %s, %s, %s, %s, %s) ON CONFLICT (series_name) DO NOTHING RETURNING series_id;", (name, drive_link, style_guide, group_id, mangadex, github_link, thumbnail))
             self.connection.commit()
+            names.invalidate("series")
+            names.invalidate("ai_context")
 
             series_id = self.cursor.fetchone()
 
@@ -74,6 +74,11 @@ class Series:
             """
             self.cursor.execute(query, (group_name, series_name))
             self.connection.commit()
+            names.invalidate("series", group_name)
+            names.invalidate("chapters", series_name)
+            names.invalidate("added_jobs", series_name)
+            names.invalidate("unadded_jobs", series_name)
+            names.invalidate("ai_context")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -96,6 +101,7 @@ class Series:
         try:
             self.cursor.execute("UPDATE series SET group_id = %s WHERE group_id = %s", (group_to_id, group_from_id))
             self.connection.commit()
+            names.invalidate("series")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -192,6 +198,11 @@ class Series:
             try:
                 self.cursor.execute(f"UPDATE series SET {', '.join(updates)} WHERE series_name = %s", tuple(params))
                 self.connection.commit()
+                names.invalidate("series")
+                names.invalidate("chapters", series_name)
+                names.invalidate("added_jobs", series_name)
+                names.invalidate("unadded_jobs", series_name)
+                names.invalidate("ai_context")
                 return self.cursor.rowcount
             except Exception as e:
                 self.connection.rollback()
@@ -271,6 +282,7 @@ class Series:
         try:
             self.cursor.execute("UPDATE series SET is_archived = TRUE WHERE series_id = %s", (series_id,))
             self.connection.commit()
+            names.invalidate("series")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
@@ -282,6 +294,7 @@ class Series:
         try:
             self.cursor.execute("UPDATE series SET is_archived = FALSE WHERE series_id = %s", (series_id,))
             self.connection.commit()
+            names.invalidate("series")
             return self.cursor.rowcount
         except Exception as e:
             self.connection.rollback()
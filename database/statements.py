@@ -0,0 +1,98 @@
+import re
+from psycopg2 import extensions
+
+class Row:
+    """
+    Row decoded from a prepared statement. Reads like the named tuples returned by the other queries,
+    by attribute or by position, but without building a tuple subclass for every result.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, values):
+        for field, value in zip(self.__slots__, values):
+            setattr(self, field, value)
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self.__slots__)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        return getattr(self, self.__slots__[index])
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+class ChapterRow(Row):
+    __slots__ = ("chapter_id", "chapter_name", "drive_link", "series_id", "is_archived")
+
+class SeriesJobRow(Row):
+    __slots__ = ("series_job_id", "job_id", "job_name", "role_id", "creator_id", "job_type")
+
+class AssignmentRow(Row):
+    __slots__ = ("assignment_id", "chapter_id", "series_job_id", "assigned_to", "status", "created_at", "completed_at")
+
+class Statement:
+    __slots__ = ("name", "query", "row", "arguments")
+
+    def __init__(self, name, query, row = None):
+        self.name = name
+        self.query = query
+        self.row = row
+
+        count = max((int(number) for number in re.findall(r"\$(\d+)", query)), default=0)
+        self.arguments = f"({', '.join(['%s'] * count)})" if count else ""
+
+class PreparedConnection(extensions.connection):
+    """Connection remembering which statements it has prepared, as they last as long as its session."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+def execute(connection, statement, params):
+    with connection.cursor() as cursor:
+        if statement.name not in connection.prepared:
+            cursor.execute(f"PREPARE {statement.name} AS {statement.query}")
+            connection.prepared.add(statement.name)
+
+        cursor.execute(f"EXECUTE {statement.name} {statement.arguments}", params)
+        rows = cursor.fetchall()
+
+    if statement.row is None:
+        return rows
+    return [statement.row(row) for row in rows]
+
+GET_CHAPTER = Statement("get_chapter", """
+    SELECT c.chapter_id, c.chapter_name, c.drive_link, c.series_id, c.is_archived
+    FROM chapters c
+    JOIN series s ON c.series_id = s.series_id
+    WHERE s.series_name = $1 AND c.chapter_name = $2
+""", ChapterRow)
+
+GET_ADDED_JOB = Statement("get_added_job", """
+    SELECT sj.series_job_id, j.job_id, j.job_name, j.role_id, j.creator_id, j.job_type
+    FROM Jobs j
+    INNER JOIN SeriesJobs sj ON j.job_id = sj.job_id
+    INNER JOIN Series s ON sj.series_id = s.series_id
+    WHERE s.series_name = $1 AND j.job_name = $2
+""", SeriesJobRow)
+
+GET_ASSIGNMENT = Statement("get_assignment", """
+    SELECT assignment_id, chapter_id, series_job_id, assigned_to, status, created_at, completed_at
+    FROM jobsassignments
+    WHERE chapter_id = $1 AND series_job_id = $2
+""", AssignmentRow)
+
+GET_AUTHORITY = Statement("get_authority", "SELECT authority_level FROM members WHERE discord_id = $1")
@@ -1,10 +1,7 @@
 from utils.checks import check_connection
+from .table import Table
 
-class Subscriptions:
-    def __init__(self, connection, cursor):
-        self.connection = connection
-        self.cursor = cursor
-
+class Subscriptions(Table):
     @check_connection
     def new(self, member_id, series_id):
         try:
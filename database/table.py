@@ -0,0 +1,17 @@
+from .statements import execute
+
+class Table:
+    def __init__(self, pool):
+        self.pool = pool
+
+    # Connection and cursor are bound per call by ConnectionPool, one per worker thread.
+    @property
+    def connection(self):
+        return getattr(self.pool.local, "connection", None)
+
+    @property
+    def cursor(self):
+        return getattr(self.pool.local, "cursor", None)
+
+    def execute_prepared(self, statement, *params):
+        return execute(self.connection, statement, params)
@@ -0,0 +1,73 @@
+import asyncio
+import httpx
+from typing import Optional
+
+# Listing and archiving are quick Drive metadata calls; zipping a chapter folder can take minutes.
+TIMEOUTS = {
+    "list": httpx.Timeout(20.0, connect=5.0),
+    "download_zip": httpx.Timeout(600.0, connect=5.0),
+    "archive": httpx.Timeout(30.0, connect=5.0),
+    "unarchive": httpx.Timeout(30.0, connect=5.0),
+}
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+class KeiretsuAPI:
+    def __init__(self, base_url: Optional[str], max_retries: int = 3, backoff: float = 1.0):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.client = httpx.AsyncClient(
+            base_url=base_url or "",
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        )
+
+    async def _request(self, endpoint: str, folder_id: str, stream: bool = False) -> Optional[httpx.Response]:
+        response = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                request = self.client.build_request("GET", f"/api/{endpoint}", params={ "id": folder_id }, timeout=TIMEOUTS[endpoint])
+                response = await self.client.send(request, stream=stream)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+
+                if stream:
+                    await response.aclose()
+                print(f"[Keiretsu.API] /api/{endpoint} for '{folder_id}' returned {response.status_code} (attempt {attempt + 1})")
+            except httpx.TransportError as e:
+                print(f"[Keiretsu.API] /api/{endpoint} for '{folder_id}' failed: {e!r} (attempt {attempt + 1})")
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+        return response
+
+    async def list_files(self, folder_id: str):
+        response = await self._request("list", folder_id)
+        if response is None or response.status_code != 200:
+            return None
+
+        return response.json().get("files", [])
+
+    async def download_zip(self, folder_id: str) -> Optional[httpx.Response]:
+        # Streamed so the archive never has to fit in memory; the caller must close the response.
+        response = await self._request("download_zip", folder_id, stream=True)
+        if response is None:
+            return None
+
+        if response.status_code != 200:
+            await response.aclose()
+            return None
+
+        return response
+
+    async def archive(self, folder_id: str) -> bool:
+        response = await self._request("archive", folder_id)
+        return response is not None and response.status_code == 200
+
+    async def unarchive(self, folder_id: str) -> bool:
+        response = await self._request("unarchive", folder_id)
+        return response is not None and response.status_code == 200
+
+    async def close(self):
+        await self.client.aclose()
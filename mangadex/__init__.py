@@ -1,20 +1,49 @@
-import requests
 import os
+import time
+import asyncio
+import httpx
 from typing import Optional
+from .ratelimit import RateLimiter, route_key
 
 AUTH_URL = "https://auth.mangadex.org/realms/mangadex/protocol/openid-connect/token"
 BASE_URL = "https://api.mangadex.org"
 
+IMAGE_EXTENSIONS = ["jpg", "jpeg", "png", "gif"]
+
+# Page batches can be tens of megabytes, so give them far more time than metadata calls.
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+UPLOAD_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+# Refresh this long before the access token expires, so no request has to fail with a 401 first.
+REFRESH_MARGIN = 60.0
+
+def read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
 class MangaDexAPI:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, concurrency: int = 3, requests_per_second: float = 5.0, max_retries: int = 3):
+        self.client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        )
         self.client_id: Optional[str] = None
         self.client_secret: Optional[str] = None
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
+        self.token_expires_at = 0.0
         self.uploader_uuid: Optional[str] = None
 
-    def login(self, client_id: str, client_secret: str, username: str, password: str):
+        # Batch uploads in flight at once, and the request budget they share with every other call.
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.limiter = RateLimiter(requests_per_second)
+        self.refresh_lock = asyncio.Lock()
+        # MangaDex allows a single open upload session per account, so uploads have to take turns.
+        self.upload_lock = asyncio.Lock()
+
+    async def login(self, client_id: str, client_secret: str, username: str, password: str):
         request_body = {
             "grant_type": "password",
             "client_id": client_id,
@@ -23,28 +52,39 @@ class MangaDexAPI:
             "password": password
         }
 
-        response = requests.post(AUTH_URL, data=request_body)
+        response = await self.client.post(AUTH_URL, data=request_body)
 
         if response.status_code == 200:
             print(f"[MangaDex.API] Logged in as {os.getenv('MangaDexLogin')}")
-            self.access_token = response.json()['access_token']
-            self.refresh_token = response.json()['refresh_token']
             self.client_id = client_id
             self.client_secret = client_secret
-            self._update_auth_header()
+            self._update_tokens(response.json())
 
-            response = self.me()
-            self.uploader_uuid = response["id"]
+            # Not retried, since a failed login can run while refresh_lock is held.
+            response = await self._request("GET", "/user/me", False)
+            self.uploader_uuid = response.json()["data"]["id"]
         else:
             print(f"[MangaDex.API] Login request failed with status code {response.status_code}")
             print(response.text)
             return None
-        
-    def refresh(self):
+
+    async def ensure_login(self):
+        # Logs in with the credentials from the environment unless already logged in, so a failed login is retried on next use.
+        if self.access_token:
+            return True
+
+        try:
+            await self.login(client_id=os.getenv("MangaDexId"), client_secret=os.getenv("MangaDexSecret"), username=os.getenv("MangaDexLogin"), password=os.getenv("MangaDexPassword"))
+        except Exception as e:
+            print(f"[MangaDex.API] Login failed: {e!r}")
+
+        return bool(self.access_token)
+
+    async def refresh(self):
         if not self.refresh_token:
             print("[MangaDex.API] Tried to refresh access token without refresh token")
             return None
-        
+
         request_body = {
             "grant_type": "refresh_token",
             "client_id": self.client_id,
@@ -52,68 +92,136 @@ class MangaDexAPI:
             "refresh_token": self.refresh_token
         }
 
-        response = self._request("POST", AUTH_URL, True, data=request_body)
+        response = await self.client.post(AUTH_URL, data=request_body)
         if response.status_code == 200:
-            self.access_token = response.json()['access_token']
-            self.refresh_token = response.json()['refresh_token']
-            self._update_auth_header()
+            self._update_tokens(response.json())
+            return True
         else:
             print(f"[MangaDex.API] Refresh request failed with status code {response.status_code}")
             print(response.text)
             return None
-        
-    def _update_auth_header(self):
-        self.session.headers.update({
+
+    async def _renew(self):
+        # Refreshes the tokens, or logs in again once the refresh token isn't accepted. Called with refresh_lock held.
+        if await self.refresh():
+            return True
+
+        print("[MangaDex.API] Logging in again after a failed refresh")
+        self.access_token = None
+        return await self.ensure_login()
+
+    def _update_tokens(self, data):
+        self.access_token = data['access_token']
+        self.refresh_token = data['refresh_token']
+        self.token_expires_at = time.monotonic() + data.get('expires_in', 900)
+        self.client.headers.update({
             "Authorization": f"Bearer {self.access_token}"
         })
 
-    def _request(self, method: str, url: str, retry: bool = True, **kwargs):
-        response = self.session.request(method, f"{BASE_URL}{url}", **kwargs)
+    async def _ensure_fresh_token(self):
+        if not self.refresh_token or time.monotonic() < self.token_expires_at - REFRESH_MARGIN:
+            return
+
+        # Concurrent uploads all notice the expiry at once; only the first one refreshes.
+        async with self.refresh_lock:
+            if time.monotonic() >= self.token_expires_at - REFRESH_MARGIN:
+                await self._renew()
+
+    async def _request(self, method: str, url: str, retry: bool = True, **kwargs):
+        await self._ensure_fresh_token()
+        route = route_key(method, url)
+
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire(route)
+            token = self.access_token
+            response = await self.client.request(method, url, **kwargs)
+            self.limiter.update(route, response.headers)
+
+            if response.status_code != 429:
+                break
+
+            delay = self.limiter.retry_after(response.headers)
+            print(f"[MangaDex.API] {route} was rate limited, retrying in {delay:.1f}s (attempt {attempt + 1})")
+            self.limiter.block(route, delay)
 
         if response.status_code == 401 and retry and self.refresh_token:
-            self.refresh()
-            return self._request(method, url, retry=False, **kwargs)
-        
+            async with self.refresh_lock:
+                # Concurrent requests rejected with the same token renew it once; the rest just retry with the new one.
+                if self.access_token == token:
+                    await self._renew()
+            return await self._request(method, url, retry=False, **kwargs)
+
         return response
-    
-    def me(self):
-        response = self._request("GET", "/user/me")
+
+    async def me(self):
+        response = await self._request("GET", "/user/me")
         return response.json()["data"]
-    
-    def group_by_id(self, group_id: str):
-        response = self._request("GET", f"/group/{group_id}")
+
+    async def group_by_id(self, group_id: str):
+        response = await self._request("GET", f"/group/{group_id}")
         return response.json()["data"]
-    
-    def check_for_session(self):
-        response = self._request("GET", "/upload")
-        if response.ok:
+
+    async def check_for_session(self):
+        response = await self._request("GET", "/upload")
+        if response.is_success:
             session_id = response.json()["data"]["id"]
             return session_id
         else:
             return None
-        
-    def abandon_session(self, session_id):
-        response = self._request("DELETE", f"/upload/{session_id}")
-        if not response.ok:
+
+    async def abandon_session(self, session_id):
+        response = await self._request("DELETE", f"/upload/{session_id}")
+        if not response.is_success:
             print(f"[MangaDex.API] Failed to abandon session before uploading: {response.status_code}")
             return False
 
         return True
-    
-    def create_session(self, group_ids, series_id):
-        response = self._request("POST", "/upload/begin", True, json={ "groups": group_ids, "manga": series_id })
-        if response.ok:
+
+    async def create_session(self, group_ids, series_id):
+        response = await self._request("POST", "/upload/begin", True, json={ "groups": group_ids, "manga": series_id })
+        if response.is_success:
             session_id = response.json()["data"]["id"]
             return session_id
         else:
             print(f"[MangaDex.API] Session could not be created. Status code {response.status_code}")
             return None
-        
-    def upload_chapter(self, session_id, volume_number, chapter_number, chapter_name, language, folder_path, batch_size = 5):
+
+    async def _upload_batch(self, session_id, batch):
+        # Pages are read into memory up front, so no file handle outlives this call.
+        files = []
+        for count, image in enumerate(batch, start=1):
+            content = await asyncio.to_thread(read_file, image["path"])
+            files.append((f"file{count}", (image["filename"], content, "image/" + image["extension"])))
+
+        try:
+            response = await self._request("POST", f"/upload/{session_id}", True, files=files, timeout=UPLOAD_TIMEOUT)
+        except httpx.TransportError as e:
+            print(f"[MangaDex.API] Batch upload failed: {e!r}")
+            return [], batch
+
+        if not response.is_success:
+            print(f"[MangaDex.API] Batch upload failed with status code {response.status_code}")
+            print(response.text)
+            return [], batch
+
+        uploaded = {
+            session_file["attributes"]["originalFileName"]: session_file["id"]
+            for session_file in response.json()["data"]
+        }
+
+        successful = [{ "id": uploaded[image["filename"]], "filename": image["filename"] } for image in batch if image["filename"] in uploaded]
+        failed = [image for image in batch if image["filename"] not in uploaded]
+        return successful, failed
+
+    async def upload_chapter(self, session_id, volume_number, chapter_number, chapter_name, language, folder_path, batch_size = 5, max_attempts = 3, on_progress = None, progress_interval = 2.0, uploaded_pages = None, on_uploaded = None, on_commit = None):
+        # `uploaded_pages` maps filenames already in the session to their file IDs, and those are not sent again.
+        # `on_uploaded` is awaited with every batch of newly uploaded pages, so callers can checkpoint them.
+        # `on_commit` is awaited right before the session is committed, and again with the chapter ID once it is.
+        uploaded_pages = uploaded_pages or {}
         page_map = []
 
         for filename in os.listdir(folder_path):
-            if "." not in filename or filename.split(".")[-1].lower() not in ["jpg", "jpeg", "png", "gif"]:
+            if "." not in filename or filename.split(".")[-1].lower() not in IMAGE_EXTENSIONS:
                 continue
 
             page_map.append({
@@ -122,60 +230,47 @@ class MangaDexAPI:
                 "path": os.path.join(folder_path, filename)
             })
 
-        successful = []
-        failed = []
-        batches = [
-            page_map[_l : _l + batch_size]
-            for _l in range(0, len(page_map), batch_size)
-        ]
-
-        for i in range(len(batches)):
-            current_batch = batches[i]
-
-            files = [
-                (
-                    f"file{count}",
-                    (
-                        image["filename"],
-                        open(image["path"], "rb"),
-                        "image/" + image["extension"],
-                    ),
-                )
-                for count, image in enumerate(
-                    current_batch, start=1
-                )
-            ]
-
-            response = self._request("POST", f"/upload/{session_id}", True, files=files)
-            response_json = response.json()
-
-            if response.ok:
-                data = response_json["data"]
-
-                for session_file in data:
-                    successful.append({
-                        "id": session_file["id"],
-                        "filename": session_file["attributes"]["originalFileName"]
-                    })
-
-                for image in current_batch:
-                    if image["filename"] not in [
-                        page["filename"]
-                        for page in successful
-                    ]:
-                        failed.append(image)
-
-                start = i * batch_size
-                end = start + batch_size - 1
-
-                print(
-                    f"Batch {start}-{end}:",
-                    "Successful:", len(data), "|",
-                    "Failed:", len(current_batch) - len(data),
-                )
-            else:
-                print("An error occured")
-                print(response_json)
+        successful = [{ "id": uploaded_pages[image["filename"]], "filename": image["filename"] } for image in page_map if image["filename"] in uploaded_pages]
+        pending = [image for image in page_map if image["filename"] not in uploaded_pages]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        last_report = 0.0
+
+        async def upload_batch(batch, failed):
+            nonlocal last_report
+
+            async with semaphore:
+                batch_successful, batch_failed = await self._upload_batch(session_id, batch)
+
+            successful.extend(batch_successful)
+            failed.extend(batch_failed)
+
+            if on_uploaded and batch_successful:
+                await on_uploaded(batch_successful)
+
+            # Discord rate limits message edits, so only report every few seconds.
+            now = time.monotonic()
+            if on_progress and now - last_report >= progress_interval:
+                last_report = now
+                await on_progress(len(successful), len(page_map), [image["filename"] for image in failed])
+
+        # Only the pages that failed are retried, in fresh batches.
+        for attempt in range(max_attempts):
+            if not pending:
+                break
+
+            failed = []
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            await asyncio.gather(*(upload_batch(batch, failed) for batch in batches))
+
+            print(f"[MangaDex.API] Attempt {attempt + 1}: Successful: {len(successful)} | Failed: {len(failed)}")
+            pending = failed
+
+            if on_progress:
+                await on_progress(len(successful), len(page_map), [image["filename"] for image in pending])
+
+        if pending:
+            print(f"[MangaDex.API] Chapter could not be uploaded, pages failed: {', '.join(image['filename'] for image in pending)}")
+            return None
 
         successful.sort(key=lambda a: a["filename"])
         page_order = [page["id"] for page in successful]
@@ -187,12 +282,41 @@ class MangaDexAPI:
             "title": chapter_name
         }
 
-        response = self._request("POST", f"/upload/{session_id}/commit", True, json={ "chapterDraft": chapter_draft, "pageOrder": page_order })
-        if response.ok:
-            return response.json()["data"]["id"]
+        if on_commit:
+            await on_commit(None)
+
+        response = await self._request("POST", f"/upload/{session_id}/commit", True, json={ "chapterDraft": chapter_draft, "pageOrder": page_order })
+        if response.is_success:
+            chapter_id = response.json()["data"]["id"]
+            if on_commit:
+                await on_commit(chapter_id)
+            return chapter_id
         else:
             print("[MangaDex.API] Chapter could not be uploaded.")
             print(response.json())
             return None
 
-                
\ No newline at end of file
+    async def find_chapter(self, series_id, chapter_number, language, group_ids, created_since):
+        # Newest chapter matching an upload, created after `created_since` (UTC).
+        params = {
+            "manga": series_id,
+            "chapter": str(chapter_number),
+            "translatedLanguage[]": [language],
+            "groups[]": group_ids,
+            "createdAtSince": created_since.strftime("%Y-%m-%dT%H:%M:%S"),
+            "includeFuturePublishAt": 1,
+            "includeEmptyPages": 1,
+            "order[createdAt]": "desc",
+            "limit": 1
+        }
+
+        response = await self._request("GET", "/chapter", params=params)
+        if not response.is_success:
+            print(f"[MangaDex.API] Failed to look up chapter {chapter_number}: {response.status_code}")
+            return None
+
+        chapters = response.json()["data"]
+        return chapters[0]["id"] if chapters else None
+
+    async def close(self):
+        await self.client.aclose()
@@ -0,0 +1,72 @@
+import re
+import time
+import asyncio
+from typing import Optional
+
+ID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+def route_key(method: str, url: str) -> str:
+    # MangaDex limits per endpoint, not per resource, so IDs are folded out of the path.
+    return f"{method} {ID_PATTERN.sub('{id}', url)}"
+
+class RateLimiter:
+    """
+    Token bucket for MangaDex's global request limit, plus per-endpoint pauses driven by the
+    X-RateLimit-* headers and 429 responses the API sends back. Requests wait their turn in FIFO order.
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.blocked_until = {}
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, route: str):
+        delay = self.blocked_until.get(route, 0.0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def block(self, route: str, seconds: float):
+        self.blocked_until[route] = max(self.blocked_until.get(route, 0.0), time.monotonic() + seconds)
+
+    def update(self, route: str, headers):
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_at = headers.get("X-RateLimit-Retry-After")
+
+        try:
+            if remaining is not None and int(remaining) <= 0 and reset_at:
+                # The header is the unix time the endpoint's window resets.
+                self.block(route, float(reset_at) - time.time())
+        except ValueError:
+            pass
+
+    def retry_after(self, headers, default: float = 1.0) -> float:
+        for header, absolute in (("Retry-After", False), ("X-RateLimit-Retry-After", True)):
+            value = headers.get(header)
+            if not value:
+                continue
+
+            try:
+                seconds = float(value) - time.time() if absolute else float(value)
+            except ValueError:
+                continue
+
+            return max(seconds, default)
+
+        return default
@@ -1,50 +1,69 @@
 import discord
 from natsort import natsorted
+from database.cache import names
+from utils.search import SearchIndex
 
-async def get_group_list(ctx: discord.AutocompleteContext):
-    groups = ctx.bot.database.groups.get_all()
+async def search_names(ctx, kind, key, load, sort = True):
+    # Each cached list is kept as a search index, so only the best 25 matches are ever sent back.
+    index = names.get(kind, key)
+    if index is None:
+        generation = names.generation
+        rows = await load()
+        if rows is None:
+            return []
+
+        index = SearchIndex(natsorted(rows) if sort else rows)
+        names.set(kind, key, index, generation)
 
-    if groups:
-        return [group.group_name for group in groups]
+    return index.search(ctx.value)
 
-    return []
+async def get_group_list(ctx: discord.AutocompleteContext):
+    async def load():
+        groups = await ctx.bot.database.groups.get_all()
+        return [group.group_name for group in groups] if groups is not None else None
+
+    return await search_names(ctx, "groups", None, load)
 
 async def get_series_list(ctx: discord.AutocompleteContext):
-    series_list = ctx.bot.database.series.get_by_group_name(ctx.options['group_name'])
+    group_name = ctx.options['group_name']
 
-    if series_list:
-        return [series.series_name for series in series_list]
+    async def load():
+        series_list = await ctx.bot.database.series.get_by_group_name(group_name)
+        return [series.series_name for series in series_list] if series_list is not None else None
 
-    return []
+    return await search_names(ctx, "series", group_name, load)
 
 async def get_chapter_list(ctx: discord.AutocompleteContext):
-    chapters = ctx.bot.database.chapters.get_by_series_name(ctx.options['series_name'])
+    series_name = ctx.options['series_name']
 
-    if chapters:
-        return natsorted([chapter.chapter_name for chapter in chapters])
+    async def load():
+        chapters = await ctx.bot.database.chapters.get_by_series_name(series_name)
+        return [chapter.chapter_name for chapter in chapters] if chapters is not None else None
 
-    return []
+    return await search_names(ctx, "chapters", series_name, load)
 
 async def get_unadded_jobs(ctx: discord.AutocompleteContext):
-    jobs = ctx.bot.database.jobs.get_unadded_all(ctx.options['series_name'])
+    series_name = ctx.options['series_name']
 
-    if jobs:
-        return [job.job_name for job in jobs]
+    async def load():
+        jobs = await ctx.bot.database.jobs.get_unadded_all(series_name)
+        return [job.job_name for job in jobs] if jobs is not None else None
 
-    return []
+    return await search_names(ctx, "unadded_jobs", series_name, load)
 
 async def get_added_jobs(ctx: discord.AutocompleteContext):
-    jobs = ctx.bot.database.jobs.get_added_all(ctx.options['series_name'])
+    series_name = ctx.options['series_name']
 
-    if jobs:
-        return [job.job_name for job in jobs]
+    # Kept in pipeline order (by job type) rather than sorted by name.
+    async def load():
+        jobs = await ctx.bot.database.jobs.get_added_all(series_name)
+        return [job.job_name for job in jobs] if jobs is not None else None
 
-    return []
+    return await search_names(ctx, "added_jobs", series_name, load, sort=False)
 
 async def get_job_list(ctx: discord.AutocompleteContext):
-    jobs = ctx.bot.database.jobs.get_all()
-
-    if jobs:
-        return [job.job_name for job in jobs]
+    async def load():
+        jobs = await ctx.bot.database.jobs.get_all()
+        return [job.job_name for job in jobs] if jobs is not None else None
 
-    return []
\ No newline at end of file
+    return await search_names(ctx, "jobs", None, load)
@@ -0,0 +1,51 @@
+import time
+import asyncio
+
+async def upload_files(catbox, file_paths, concurrency = 4, max_attempts = 3, backoff = 2.0, on_progress = None, progress_interval = 2.0, uploaded_urls = None, on_uploaded = None):
+    """
+    Uploads files to catbox from worker threads and returns their URLs in the order of `file_paths`.
+    Files found in `uploaded_urls` (path to URL) are reused, and `on_uploaded` is awaited with each new upload.
+    """
+    uploaded_urls = uploaded_urls or {}
+    semaphore = asyncio.Semaphore(concurrency)
+    uploaded = len([file_path for file_path in file_paths if file_path in uploaded_urls])
+    last_report = 0.0
+
+    async def upload(file_path):
+        nonlocal uploaded, last_report
+
+        if file_path in uploaded_urls:
+            return uploaded_urls[file_path]
+
+        async with semaphore:
+            for attempt in range(max_attempts):
+                try:
+                    url = await asyncio.to_thread(catbox.upload, file_path)
+                    break
+                except Exception as e:
+                    print(f"[Catbox] Failed to upload '{file_path}': {e} (attempt {attempt + 1})")
+                    if attempt == max_attempts - 1:
+                        raise
+
+                await asyncio.sleep(backoff * 2 ** attempt)
+
+        if on_uploaded:
+            await on_uploaded(file_path, url)
+
+        uploaded += 1
+
+        # Discord rate limits message edits, so only report every few seconds (and always the last file).
+        now = time.monotonic()
+        if on_progress and (uploaded == len(file_paths) or now - last_report >= progress_interval):
+            last_report = now
+            await on_progress(uploaded, len(file_paths))
+
+        return url
+
+    tasks = [asyncio.create_task(upload(file_path)) for file_path in file_paths]
+    try:
+        return await asyncio.gather(*tasks)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        raise
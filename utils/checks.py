@@ -4,11 +4,11 @@ from functools import wraps
 
 def check_connection(func):
     @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        if not self.cursor:
+    async def wrapper(self, *args, **kwargs):
+        if not self.pool:
             print("No connection to the database.")
             return None
-        return func(self, *args, **kwargs)
+        return await self.pool.run(func, self, *args, **kwargs)
     return wrapper
 
 def check_authority(minimum_level):
@@ -16,7 +16,7 @@ def check_authority(minimum_level):
         if str(ctx.author.id) == os.getenv("DiscordOwnerId") or str(ctx.author.id) == os.getenv("DiscordDevId"):
             return True
 
-        authority = ctx.bot.database.members.get_authority(str(ctx.author.id))
+        authority = await ctx.bot.database.members.get_authority(str(ctx.author.id))
         if authority is None or authority < minimum_level:
             return False
         return True
@@ -124,4 +124,19 @@ class StaffLevel:
             discord.OptionChoice(name="Trial", value=StaffLevel.Trial),
             discord.OptionChoice(name="Probationary", value=StaffLevel.Probationary),
             discord.OptionChoice(name="Full", value=StaffLevel.Full),
-        ]
\ No newline at end of file
+        ]
+
+class UploadStatus:
+    Pending = 0
+    Running = 1
+    Completed = 2
+    Failed = 3
+
+    @staticmethod
+    def to_string(status):
+        return {
+            UploadStatus.Pending: "Pending",
+            UploadStatus.Running: "Uploading",
+            UploadStatus.Completed: "Uploaded",
+            UploadStatus.Failed: "Failed"
+        }.get(status, "Unknown")
@@ -0,0 +1,39 @@
+from functools import lru_cache
+from utils.constants import JobType
+
+# Job types that have to be completed before a job type can start. A series that doesn't use one of them
+# inherits its prerequisites instead, e.g. without Proofreading, Typesetting waits on Translation.
+STAGES = {
+    JobType.Translation: (),
+    JobType.Proofreading: (JobType.Translation,),
+    JobType.Cleaning: (),
+    JobType.Redrawing: (),
+    JobType.Typesetting: (JobType.Proofreading, JobType.Cleaning, JobType.Redrawing),
+    JobType.TypesettingSFX: (JobType.Proofreading, JobType.Cleaning, JobType.Redrawing),
+    JobType.Quality: (JobType.Typesetting, JobType.TypesettingSFX),
+    JobType.Managment: (JobType.Quality,)
+}
+
+class Pipeline:
+    def __init__(self, job_types):
+        self.job_types = frozenset(job_types)
+        self.requires = { job_type: self._resolve(job_type) for job_type in self.job_types }
+        self.unlocks = {
+            job_type: frozenset(other for other, requires in self.requires.items() if job_type in requires)
+            for job_type in self.job_types
+        }
+
+    def _resolve(self, job_type):
+        requires = set()
+        for dependency in STAGES.get(job_type, ()):
+            if dependency in self.job_types:
+                requires.add(dependency)
+            else:
+                requires |= self._resolve(dependency)
+
+        return frozenset(requires)
+
+@lru_cache(maxsize=None)
+def compile_pipeline(job_types: frozenset):
+    # Series using the same set of job types share one compiled graph.
+    return Pipeline(job_types)
@@ -0,0 +1,58 @@
+import os
+import time
+import asyncio
+import warnings
+import psd_tools
+from PIL import Image
+
+warnings.filterwarnings("ignore", module="psd_tools")
+
+def convert_psd(psd_file_path: str, grayscale: bool):
+    # Runs inside a worker process, so it must stay a plain module-level function.
+    psd = psd_tools.PSDImage.open(psd_file_path)
+    image = psd.composite()
+
+    if grayscale:
+        image = image.convert('L')
+        image = image.convert('P', palette=Image.ADAPTIVE, colors=256)
+
+    png_file_path = os.path.splitext(psd_file_path)[0] + '.png'
+    image.save(png_file_path, format='PNG', optimize=True)
+
+    os.remove(psd_file_path)
+    return png_file_path
+
+class PsdConverter:
+    """Converts PSDs in the process pool as soon as they are submitted, e.g. while the archive is still downloading."""
+
+    def __init__(self, executor, grayscale: bool):
+        self.executor = executor
+        self.grayscale = grayscale
+        self.futures = []
+
+    def submit(self, psd_file_path: str):
+        loop = asyncio.get_running_loop()
+        self.futures.append(loop.run_in_executor(self.executor, convert_psd, psd_file_path, self.grayscale))
+
+    def cancel(self):
+        for future in self.futures:
+            future.cancel()
+
+    async def wait(self, on_progress = None, progress_interval = 2.0):
+        converted = []
+        last_report = 0.0
+
+        try:
+            for future in asyncio.as_completed(self.futures):
+                converted.append(await future)
+
+                # Discord rate limits message edits, so only report every few seconds (and always the last page).
+                now = time.monotonic()
+                if on_progress and (len(converted) == len(self.futures) or now - last_report >= progress_interval):
+                    last_report = now
+                    await on_progress(len(converted), len(self.futures))
+        except Exception:
+            self.cancel()
+            raise
+
+        return converted
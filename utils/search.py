@@ -0,0 +1,74 @@
+import heapq
+from bisect import bisect_left
+
+MAX_RESULTS = 25
+
+def trigrams(text):
+    padded = f"  {text} "
+    return { padded[i:i + 3] for i in range(len(padded) - 2) }
+
+class SearchIndex:
+    """
+    Ranked lookup over a list of names, kept in the list's own order: names starting with the query
+    first, then names with a word starting with it, then trigram matches by similarity.
+    """
+
+    def __init__(self, names, min_similarity = 0.5):
+        self.names = list(names)
+        self.min_similarity = min_similarity
+
+        # (lowercased key, position) pairs sorted by key, so every prefix match is one contiguous range.
+        self.prefixes = sorted((name.lower(), position) for position, name in enumerate(self.names))
+        self.words = sorted(
+            (word, position)
+            for position, name in enumerate(self.names)
+            for word in set(name.lower().split()[1:])
+        )
+
+        self.grams = [trigrams(name.lower()) for name in self.names]
+        self.postings = {}
+        for position, grams in enumerate(self.grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(position)
+
+    def _prefix_range(self, keys, query):
+        start = bisect_left(keys, (query,))
+        end = bisect_left(keys, (query + "\U0010ffff",))
+        return (position for _, position in keys[start:end])
+
+    def _fuzzy(self, query, exclude, limit):
+        query_grams = trigrams(query)
+        shared = {}
+        for gram in query_grams:
+            for position in self.postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        scored = []
+        for position, count in shared.items():
+            if position in exclude:
+                continue
+
+            # Share of the query found in the name, so long names aren't penalised for their length.
+            similarity = count / len(query_grams)
+            if similarity >= self.min_similarity:
+                scored.append((-similarity, position))
+
+        return [position for _, position in heapq.nsmallest(limit, scored)]
+
+    def search(self, query, limit = MAX_RESULTS):
+        query = (query or "").strip().lower()
+        if not query:
+            return self.names[:limit]
+
+        results = heapq.nsmallest(limit, self._prefix_range(self.prefixes, query))
+        seen = set(results)
+
+        if len(results) < limit:
+            words = sorted(set(self._prefix_range(self.words, query)) - seen)[:limit - len(results)]
+            results += words
+            seen.update(words)
+
+        if len(results) < limit:
+            results += self._fuzzy(query, seen, limit - len(results))
+
+        return [self.names[position] for position in results]
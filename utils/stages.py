@@ -0,0 +1,36 @@
+from utils.constants import JobStatus
+from utils.pipeline import compile_pipeline
+
+class ChapterStages:
+    """
+    Every job of a chapter's series together with its assignment on that chapter, as returned by
+    `assignments.get_stages`, evaluated against the series' compiled pipeline.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows or []
+        self.pipeline = compile_pipeline(frozenset(row.job_type for row in self.rows))
+
+        # A job type is completed once every job of that type in the series is.
+        incomplete = { row.job_type for row in self.rows if row.status != JobStatus.Completed }
+        self.completed = self.pipeline.job_types - incomplete
+
+    def of_type(self, job_type):
+        return [row for row in self.rows if row.job_type == job_type]
+
+    def blocking(self, job_type):
+        return self.pipeline.requires.get(job_type, frozenset()) - self.completed
+
+    def is_unblocked(self, job_type):
+        return not self.blocking(job_type)
+
+    def unblocked(self):
+        """Job types that can be worked on right now and aren't completed yet."""
+        return sorted(job_type for job_type in self.pipeline.job_types - self.completed if self.is_unblocked(job_type))
+
+    def unlocked_by(self, job_type):
+        """Job types ready to start now that `job_type` is completed."""
+        if job_type not in self.completed:
+            return []
+
+        return sorted(other for other in self.pipeline.unlocks.get(job_type, ()) if other not in self.completed and self.is_unblocked(other))
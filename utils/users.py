@@ -0,0 +1,82 @@
+import time
+import asyncio
+import discord
+from collections import namedtuple, OrderedDict
+
+class ResolvedUser(namedtuple("ResolvedUser", ["discord_id", "display_name", "credit_name"])):
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return self.credit_name or self.display_name
+
+class UserResolver:
+    """
+    Resolves display and credit names for many discord IDs at once: credit names in a single query,
+    display names from the gateway cache, and users missing from it over REST behind a TTL cache.
+    """
+
+    def __init__(self, bot, ttl = 600.0, cache_size = 1024):
+        self.bot = bot
+        self.ttl = ttl
+        self.cache_size = cache_size
+        # Fetched display names by ID, in insertion (and so expiry) order.
+        self.fetched = OrderedDict()
+
+    async def _fetch_display_name(self, user_id):
+        cached = self.fetched.get(user_id)
+        if cached:
+            if cached[1] > time.monotonic():
+                return cached[0]
+            del self.fetched[user_id]
+
+        try:
+            user = await self.bot.fetch_user(user_id)
+            display_name = user.display_name
+        except discord.NotFound:
+            display_name = None
+        except discord.HTTPException as e:
+            print(f"Failed to fetch user '{user_id}': {e}")
+            return None
+
+        now = time.monotonic()
+        self.fetched.pop(user_id, None)
+        self.fetched[user_id] = (display_name, now + self.ttl)
+
+        # Entries expire in the order they were added, so expired ones and the overflow are all at the front.
+        while self.fetched and (len(self.fetched) > self.cache_size or next(iter(self.fetched.values()))[1] <= now):
+            self.fetched.popitem(last=False)
+
+        return display_name
+
+    async def display_names(self, discord_ids):
+        names = {}
+        missing = []
+
+        for discord_id in discord_ids:
+            user = self.bot.get_user(int(discord_id))
+            if user:
+                names[discord_id] = user.display_name
+            else:
+                missing.append(discord_id)
+
+        fetched = await asyncio.gather(*(self._fetch_display_name(int(discord_id)) for discord_id in missing))
+        names.update(zip(missing, fetched))
+        return names
+
+    async def resolve(self, discord_ids):
+        """Maps every ID (as given) to a ResolvedUser. Unknown users get `<unknown>` as display name."""
+        discord_ids = set(discord_ids)
+        if not discord_ids:
+            return {}
+
+        credit_names, display_names = await asyncio.gather(
+            self.bot.database.members.get_credit_names([str(discord_id) for discord_id in discord_ids]),
+            self.display_names(discord_ids)
+        )
+        credit_names = credit_names or {}
+
+        return {
+            discord_id: ResolvedUser(str(discord_id), display_names.get(discord_id) or "<unknown>", credit_names.get(str(discord_id)))
+            for discord_id in discord_ids
+        }
@@ -8,7 +8,7 @@ class JobboardView(discord.ui.View):
 
     @discord.ui.button(label="Claim", custom_id="jobboard_claim_button", style=discord.ButtonStyle.primary)
     async def button_callback(self, button, interaction):
-        jobboard_post = interaction.client.database.boardposts.get_by_message(str(interaction.message.id))
+        jobboard_post = await interaction.client.database.boardposts.get_by_message(str(interaction.message.id))
 
         if not jobboard_post:
             await interaction.message.delete()
@@ -21,7 +21,7 @@ class JobboardView(discord.ui.View):
         }
 
         member = interaction.user
-        if interaction.client.database.members.get(str(member.id)) is None:
+        if await interaction.client.database.members.get(str(member.id)) is None:
             return
 
         user_staff_level = -1 
@@ -32,17 +32,17 @@ class JobboardView(discord.ui.View):
         if user_staff_level < jobboard_post.staff_level:
             return
 
-        is_first_job = interaction.client.database.assignments.is_first(str(member.id))
-        assignment_id = interaction.client.database.assignments.new(jobboard_post.chapter_id, jobboard_post.series_job_id, str(member.id))
+        is_first_job = await interaction.client.database.assignments.is_first(str(member.id))
+        assignment_id = await interaction.client.database.assignments.new(jobboard_post.chapter_id, jobboard_post.series_job_id, str(member.id))
         if assignment_id is None:
             return
 
         await interaction.message.delete()
-        interaction.client.database.boardposts.delete(jobboard_post.boardpost_id)
+        await interaction.client.database.boardposts.delete(jobboard_post.boardpost_id)
 
-        chapter = interaction.client.database.chapters.get_by_id(jobboard_post.chapter_id)
-        series = interaction.client.database.series.get_by_id(chapter.series_id)
-        series_job = interaction.client.database.jobs.get_added_by_id(jobboard_post.series_job_id)
+        chapter = await interaction.client.database.chapters.get_by_id(jobboard_post.chapter_id)
+        series = await interaction.client.database.series.get_by_id(chapter.series_id)
+        series_job = await interaction.client.database.jobs.get_added_by_id(jobboard_post.series_job_id)
 
         channel = interaction.client.get_channel(int(os.getenv("MilizeChannelId")))
         if channel:
@@ -63,4 +63,4 @@ class JobboardView(discord.ui.View):
             if is_first_job:
                 await channel.send(embed=info("Since this is your first job, please consider checking if there's any important material to read (like a style guide). Usually, it's available in the pinned messages for the channel of the series."))
 
-            interaction.client.database.members.update_activity(str(member.id))
\ No newline at end of file
+            await interaction.client.database.members.update_activity(str(member.id))
\ No newline at end of file
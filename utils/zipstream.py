@@ -0,0 +1,285 @@
+import os
+import zlib
+import struct
+import asyncio
+import zipfile
+
+LOCAL_FILE_HEADER = b"PK\x03\x04"
+CENTRAL_DIRECTORY_HEADER = b"PK\x01\x02"
+END_OF_CENTRAL_DIRECTORY = b"PK\x05\x06"
+DATA_DESCRIPTOR = b"PK\x07\x08"
+
+FLAG_ENCRYPTED = 0x1
+FLAG_DATA_DESCRIPTOR = 0x8
+FLAG_UTF8 = 0x800
+
+METHOD_STORED = 0
+METHOD_DEFLATED = 8
+
+CHUNK_SIZE = 1 << 20
+
+class ZipStreamExtractor:
+    """
+    Extracts zip members from a byte stream as it arrives, relying on local file headers only.
+
+    Anything it cannot handle without the central directory (stored members with a data descriptor,
+    encryption, other compression methods) makes it give up; `failed` is then set and the caller is
+    expected to extract the rest from the complete archive.
+    """
+
+    def __init__(self, destination):
+        self.destination = destination
+        self.buffer = bytearray()
+        self.state = "header"
+        self.failed = False
+        self.extracted = set()
+        self.completed = []
+
+        self.member = None
+        self.file = None
+        self.decompressor = None
+        self.remaining = None
+        self.crc = 0
+
+    @property
+    def done(self):
+        return self.state == "done"
+
+    def feed(self, data):
+        """Consumes the next chunk of the archive and returns paths of members completed by it."""
+        if self.failed or self.done:
+            return []
+
+        self.buffer += data
+        steps = {
+            "header": self._read_header,
+            "data": self._read_data,
+            "descriptor": self._read_descriptor
+        }
+
+        try:
+            while not self.failed and not self.done and steps[self.state]():
+                pass
+        except (zlib.error, struct.error, OSError, UnicodeDecodeError) as e:
+            print(f"Streaming zip extraction stopped: {e}")
+            self._give_up()
+
+        completed, self.completed = self.completed, []
+        return completed
+
+    def close(self):
+        if self.file:
+            self._give_up()
+
+    def _give_up(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+            self._remove_member()
+
+        self.failed = True
+        self.buffer = bytearray()
+
+    def _remove_member(self):
+        try:
+            os.remove(self.member["path"])
+        except OSError:
+            pass
+
+    def _read_header(self):
+        if len(self.buffer) < 4:
+            return False
+
+        signature = bytes(self.buffer[:4])
+        if signature in (CENTRAL_DIRECTORY_HEADER, END_OF_CENTRAL_DIRECTORY):
+            self.state = "done"
+            self.buffer = bytearray()
+            return False
+
+        if signature != LOCAL_FILE_HEADER:
+            self._give_up()
+            return False
+
+        if len(self.buffer) < 30:
+            return False
+
+        _, _, flags, method, _, _, crc, compressed_size, size, name_length, extra_length = struct.unpack("<IHHHHHIIIHH", self.buffer[:30])
+        if len(self.buffer) < 30 + name_length + extra_length:
+            return False
+
+        raw_name = bytes(self.buffer[30:30 + name_length])
+        extra = bytes(self.buffer[30 + name_length:30 + name_length + extra_length])
+        del self.buffer[:30 + name_length + extra_length]
+
+        name = raw_name.decode("utf-8" if flags & FLAG_UTF8 else "cp437")
+        compressed_size, size, zip64 = self._parse_zip64(extra, compressed_size, size)
+
+        has_descriptor = bool(flags & FLAG_DATA_DESCRIPTOR)
+        if flags & FLAG_ENCRYPTED or method not in (METHOD_STORED, METHOD_DEFLATED) or (has_descriptor and method == METHOD_STORED):
+            self._give_up()
+            return False
+
+        path = self._safe_path(name)
+        if path is None:
+            self._give_up()
+            return False
+
+        self.member = {
+            "name": name,
+            "path": path,
+            "crc": crc,
+            "zip64": zip64,
+            "descriptor": has_descriptor,
+            "is_dir": name.endswith("/")
+        }
+        self.remaining = None if has_descriptor else compressed_size
+        self.decompressor = zlib.decompressobj(-zlib.MAX_WBITS) if method == METHOD_DEFLATED else None
+        self.crc = 0
+
+        if self.member["is_dir"]:
+            os.makedirs(path, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.file = open(path, "wb")
+
+        self.state = "data"
+        return True
+
+    def _parse_zip64(self, extra, compressed_size, size):
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, data_size = struct.unpack("<HH", extra[offset:offset + 4])
+            data = extra[offset + 4:offset + 4 + data_size]
+            if header_id == 0x0001:
+                # Fields are present only when the 32-bit header value is saturated, in this order.
+                fields = iter(struct.unpack(f"<{len(data) // 8}Q", data[:len(data) // 8 * 8]))
+                if size == 0xFFFFFFFF:
+                    size = next(fields, size)
+                if compressed_size == 0xFFFFFFFF:
+                    compressed_size = next(fields, compressed_size)
+                return compressed_size, size, True
+            offset += 4 + data_size
+
+        return compressed_size, size, False
+
+    def _safe_path(self, name):
+        parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".")]
+        if not parts or ".." in parts or os.path.isabs(name):
+            return None
+
+        return os.path.join(self.destination, *parts)
+
+    def _write(self, data):
+        if not data:
+            return
+        self.crc = zlib.crc32(data, self.crc)
+        if self.file:
+            self.file.write(data)
+
+    def _inflate(self, data):
+        while data and not self.decompressor.eof:
+            self._write(self.decompressor.decompress(data, CHUNK_SIZE))
+            data = self.decompressor.unconsumed_tail
+
+    def _read_data(self):
+        if self.remaining is not None:
+            take = min(self.remaining, len(self.buffer))
+            data = bytes(self.buffer[:take])
+            del self.buffer[:take]
+            self.remaining -= take
+
+            if self.decompressor:
+                self._inflate(data)
+            else:
+                self._write(data)
+
+            if self.remaining > 0:
+                return False
+
+            if self.decompressor:
+                self._write(self.decompressor.flush())
+        else:
+            # Size is unknown until the data descriptor, but the deflate stream marks its own end.
+            data = bytes(self.buffer)
+            self.buffer = bytearray()
+            self._inflate(data)
+
+            if not self.decompressor.eof:
+                return False
+
+            self.buffer = bytearray(self.decompressor.unused_data) + self.buffer
+
+        if self.file:
+            self.file.close()
+            self.file = None
+
+        if self.member["descriptor"]:
+            self.state = "descriptor"
+            return True
+
+        return self._complete_member(self.member["crc"])
+
+    def _read_descriptor(self):
+        has_signature = bytes(self.buffer[:4]) == DATA_DESCRIPTOR
+        offset = 4 if has_signature else 0
+        length = offset + 4 + (16 if self.member["zip64"] else 8)
+
+        if len(self.buffer) < max(length, 4):
+            return False
+
+        crc = struct.unpack("<I", self.buffer[offset:offset + 4])[0]
+        del self.buffer[:length]
+        return self._complete_member(crc)
+
+    def _complete_member(self, crc):
+        if self.member["is_dir"]:
+            self.state = "header"
+            return True
+
+        if crc != self.crc:
+            self._remove_member()
+            self._give_up()
+            return False
+
+        self.extracted.add(self.member["name"])
+        self.completed.append(self.member["path"])
+        self.state = "header"
+        return True
+
+async def stream_extract(response, zip_file_path, destination, on_member = None):
+    """
+    Writes a streaming httpx response to `zip_file_path` in chunks while extracting members into
+    `destination` as soon as each one is complete. `on_member` is called with the path of every
+    extracted file. Raises zipfile.BadZipFile if the archive turns out to be invalid.
+    """
+    extractor = ZipStreamExtractor(destination)
+    os.makedirs(destination, exist_ok=True)
+
+    def write_chunk(file, chunk):
+        file.write(chunk)
+        return extractor.feed(chunk)
+
+    try:
+        with open(zip_file_path, "wb") as file:
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                for path in await asyncio.to_thread(write_chunk, file, chunk):
+                    if on_member:
+                        on_member(path)
+    finally:
+        extractor.close()
+        await response.aclose()
+
+    if extractor.failed or not extractor.done:
+        # Fall back to the central directory for whatever could not be streamed.
+        def extract_remaining():
+            paths = []
+            with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
+                for info in zip_ref.infolist():
+                    if info.is_dir() or info.filename in extractor.extracted:
+                        continue
+                    paths.append(zip_ref.extract(info, destination))
+            return paths
+
+        for path in await asyncio.to_thread(extract_remaining):
+            if on_member:
+                on_member(path)